@@ -1,4 +1,9 @@
 from .cell import Cell
 from .timer_ import Timer
 from .config import Config
-from .flagged_counter import FlaggedCounter
\ No newline at end of file
+from .flagged_counter import FlaggedCounter
+from .startup_log import StartupLog
+from .snapshot import Snapshot
+from .history import History, Move
+from .backend import TkBackend
+from .minefield import place_mines
\ No newline at end of file
@@ -0,0 +1,35 @@
+from tkinter import Tk, Frame, Button, Label, Menu, Misc
+
+
+class TkBackend:
+    """Creates the tkinter widgets the game is drawn with. Default backend.
+
+    Other backends return objects that act like the small part of tkinter the game
+    uses: 'configure', reading options with [], 'grid', 'grid_rowconfigure',
+    'grid_columnconfigure', 'bind', 'after', 'after_cancel' and 'destroy'.
+    Roots also take 'title', 'iconbitmap', 'protocol', 'geometry', 'winfo_height',
+    setting options with [] and 'mainloop'. Menus take 'add_command', 'index' and
+    'entryconfigure'. 'RecordingBackend' is one that needs no display.
+    """
+    # Widgets receive clicks, so cells bind their handlers to them
+    events = True
+
+    def root(self) -> Tk:
+        """Main game window"""
+        return Tk()
+
+    def frame(self, location: Misc, **options) -> Frame:
+        """Container for other widgets"""
+        return Frame(location, **options)
+
+    def button(self, location: Misc, **options) -> Button:
+        """Clickable button, used for cells and reset"""
+        return Button(location, **options)
+
+    def label(self, location: Misc, **options) -> Label:
+        """Text display, used for timer and mines left counter"""
+        return Label(location, **options)
+
+    def menu(self, location: Misc) -> Menu:
+        """Menu bar of the main window"""
+        return Menu(location)
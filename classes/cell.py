@@ -1,5 +1,4 @@
-import random
-from tkinter import Button, Frame
+from tkinter import Frame
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from main import Game
@@ -17,7 +16,7 @@ class Cell:
 
     def __init__(self, location: Frame, coordinates: tuple[int, int]):
         """
-        :param tkinter.Frame location: Minefield frame
+        :param tkinter.Frame location: Minefield frame, or its equivalent from game's backend
         :param (int, int) coordinates: x and y in the grid to look up neighbors
         """
         self.is_mine = False
@@ -26,8 +25,8 @@ class Cell:
         self.value = 0
         self.coordinates = coordinates
 
-        # Create tkinter button
-        self.button = Button(
+        # Create button, a tkinter one unless game uses a different backend
+        self.button = self.active_game.backend.button(
             location,
             text="",
             disabledforeground="black",
@@ -37,20 +36,27 @@ class Cell:
             width=1,
             height=1
         )
-        self.button.bind("<Button-1>", lambda e: self.left_click())
-        self.button.bind("<Button-3>", lambda e: self.right_click())
+        if self.active_game.backend.events:
+            self.button.bind("<Button-1>", lambda e: self.left_click())
+            self.button.bind("<Button-3>", lambda e: self.right_click())
+            # Chord with middle click, or by pressing both buttons together
+            self.button.bind("<Button-2>", lambda e: self.chord())
+            self.button.bind("<B1-Button-3>", lambda e: self.chord())
+            self.button.bind("<B3-Button-1>", lambda e: self.chord())
 
     def first_move(self):
         """Executed once at the start of the game and replaced with 'regular_move'.
         Makes first move safe, calculates values, starts timer, reveals cell.
         """
+        self.active_game.history.begin('first', self.active_game.cell_index(self))
+
         # Check if the first cell opened is a mine and move it to different cell
         if self.is_mine:
             # Remove mine from first clicked cell
             self.is_mine = False
 
             # Make random cell a new mine
-            replacement_mine = random.choice(self.active_game.not_mines)
+            replacement_mine = self.active_game.rng.choice(self.active_game.not_mines)
             replacement_mine.is_mine = True
 
             # Update corresponding lists
@@ -69,10 +75,13 @@ class Cell:
         # Update counter for an edge case where player flagged some random squares
         # at the start of the game and then hit a 0 to reveal some of those flagged cells
         self.active_game.flagged_counter.update()
+        self.active_game.history.commit()
 
     def regular_move(self):
         """Checks if you lost the game by hitting a mine. Otherwise, reveals cell"""
         if self.is_mine:
+            self.active_game.history.begin('loss', self.active_game.cell_index(self))
+            self.active_game.history.commit()
             self.button.configure(
                 bg="#f20000",
                 disabledforeground="gray",
@@ -80,29 +89,84 @@ class Cell:
             )
             self.active_game.loss()
         else:
+            self.active_game.history.begin('reveal', self.active_game.cell_index(self))
             self.reveal()
             # Update counter in case of hitting 0 to reveal some of falsely flagged cells
             self.active_game.flagged_counter.update()
+            self.active_game.history.commit()
 
     def reveal(self):
         """Show value of a cell that is not a mine
-        Calls itself recursively if you hit a 0 (black space)
+        If you hit a 0 (black space), keeps revealing neighbors until it reaches numbers.
+        """
+        self.active_game.open_cells(self.active_game.flood([self]))
+
+    def chord(self):
+        """Reveal all unflagged neighbors of a revealed number, once it has as many
+        flags next to it. Cells to open are found first, then opened together
+        with a single win or loss check. Hitting a wrongly flagged mine loses the game.
         """
-        # Check for falsely flagged mines, used during recursion call when you hit 0
+        if not self.revealed or self.value == 0 or Cell.left_click != Cell.regular_move:
+            return
+        neighbors = list(self.active_game.find_neighbors(self))
+        if sum(neighbor.flagged for neighbor in neighbors) != self.value:
+            return
+        hidden = [neighbor for neighbor in neighbors
+                  if not neighbor.revealed and not neighbor.flagged]
+        if not hidden:
+            return
+
+        mines = [cell for cell in hidden if cell.is_mine]
+        if mines:
+            self.active_game.history.begin('chord loss', self.active_game.cell_index(self))
+            self.active_game.history.commit()
+            for mine in mines:
+                mine.button.configure(bg="#f20000", disabledforeground="gray", relief="sunken")
+            self.active_game.loss()
+        else:
+            self.active_game.history.begin('chord', self.active_game.cell_index(self))
+            self.active_game.open_cells(self.active_game.flood(hidden))
+            self.active_game.flagged_counter.update()
+            self.active_game.history.commit()
+
+    def open(self):
+        """Show a single cell as revealed and disable its controls. Part of 'reveal'"""
+        self.active_game.history.opened(self.active_game.cell_index(self), self.flagged)
+
+        # Check for falsely flagged mines, used when a 0 reveals cells next to it
         if self.flagged:
             self.button.configure(text="")
             self.flagged = False
             self.active_game.flagged_counter.counter += 1
 
-        # Change buttons to represent revealed cell
-        self.button.configure(state="disabled", relief="sunken")
+        self.show_revealed()
         self.revealed = True
-        # If you hit a 0 (black space), reveals cells next to self
-        if self.value == 0:
-            for neighbor in self.active_game.find_neighbors(self):
-                if not neighbor.revealed:
-                    neighbor.reveal()
-        elif self.value == 1:
+
+        # Individually disable buttons for revealed cells in instance variables
+        self.left_click = self.disabled
+        self.right_click = self.disabled
+
+        # Update the victory condition
+        self.active_game.unrevealed_cell_count -= 1
+
+    def hide(self):
+        """Turn revealed cell back into an unrevealed one. Used to undo moves"""
+        self.show_hidden()
+        self.revealed = False
+        # Delete instance attributes that are disabling cell, reactivating it.
+        del self.left_click
+        del self.right_click
+
+    def show_hidden(self):
+        """Change button to represent unrevealed cell"""
+        self.button.configure(
+            text="", disabledforeground="black", state='normal', relief="raised"
+        )
+
+    def show_revealed(self):
+        """Change button to represent revealed cell and its value"""
+        self.button.configure(state="disabled", relief="sunken")
+        if self.value == 1:
             self.button.configure(text='1', disabledforeground="#261cd9")
         elif self.value == 2:
             self.button.configure(text='2', disabledforeground="#0ea124")
@@ -119,21 +183,11 @@ class Cell:
         elif self.value == 8:
             self.button.configure(text='8', disabledforeground="gray")
 
-        # Individually disable buttons for revealed cells in instance variables
-        self.left_click = self.disabled
-        self.right_click = self.disabled
-
-        # Update the victory condition and check if it was met
-        self.active_game.unrevealed_cell_count -= 1
-        if self.active_game.unrevealed_cell_count == 0:
-            self.active_game.victory()
-
     def flag(self):
         """Set or remove flag that indicates a potential mine"""
+        self.active_game.history.begin('flag', self.active_game.cell_index(self))
         if self.flagged:
-            self.button.configure(
-                text="", disabledforeground="black", state='normal'
-            )
+            self.show_hidden()
             self.flagged = False
             # Delete instance attribute that is disabling cell, reactivating it.
             del self.left_click
@@ -148,6 +202,7 @@ class Cell:
             self.left_click = self.disabled
             self.active_game.flagged_counter.counter -= 1
         self.active_game.flagged_counter.update()
+        self.active_game.history.commit()
 
     @staticmethod
     def disabled(*args):
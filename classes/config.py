@@ -14,7 +14,6 @@ class Config:
     min_cell_size = 20
     max_cell_size = 200
     icon_file = join(dirname(__file__),'..' , 'img', 'mine.ico')
-    print(icon_file)
 
     def __init__(self, game: "Game"):
         self.active_game = game
@@ -45,6 +44,9 @@ class Config:
             'graphics', 'cell_font', fallback="Cooper Black")
         self.scoreboard_font = self.config.get(
             'graphics', 'scoreboard_font', fallback="Fixedsys")
+        # Practice mode allows taking back the move that lost the game
+        self.practice = self.config.getboolean(
+            'gameplay', 'practice', fallback=False)
 
     def calculate_resolution(self) -> str:
         """Adjust resolution to cell number and cell size
@@ -195,6 +197,9 @@ class Config:
             'cell_font': "Cooper Black",
             'scoreboard_font': "Fixedsys",
         }
+        self.config['gameplay'] = {
+            'practice': False,
+        }
 
     def save_config(self):
         """Save current changeable settings to file"""
@@ -205,6 +210,9 @@ class Config:
             'mines': self.mines,
         }
         self.config['graphics']['cell_size'] = str(self.cell_size)
+        self.config['gameplay'] = {
+            'practice': self.practice,
+        }
 
         # Save settings to external file in root directory
         with open('config.ini', 'w') as f:
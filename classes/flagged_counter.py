@@ -1,11 +1,20 @@
-from tkinter import Label, Frame
+from tkinter import Frame
+from .backend import TkBackend
 
 class FlaggedCounter:
     """Shows how many mines are left unflagged"""
 
-    def __init__(self, location: Frame, mines: int, font: tuple[str, int]):
+    def __init__(self, location: Frame, mines: int, font: tuple[str, int],
+                 backend: TkBackend = None):
+        """
+        :param tkinter.Frame location: Top bar frame
+        :param int mines: Number of mines in the game
+        :param (str, int) font: Font name and size
+        :param TkBackend backend: Creates the label, tkinter one by default
+        """
+        backend = backend or TkBackend()
         self.counter = mines
-        self.unflagged_count = Label(
+        self.unflagged_count = backend.label(
             location,
             text=f'{self.counter:02d}🕸',
             font=font,
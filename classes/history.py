@@ -0,0 +1,70 @@
+from array import array
+from typing import Callable
+
+
+class Move:
+    """Changes made by a single move. Only indexes of changed cells are stored,
+    so a move takes memory proportional to the number of cells it changed.
+    """
+    __slots__ = ('kind', 'origin', 'opened', 'unflagged')
+    # Kinds of moves that lost the game
+    losing_kinds = ('loss', 'chord loss')
+
+    def __init__(self, kind: str, origin: int):
+        """
+        :param str kind: 'first', 'reveal', 'flag', 'chord', 'loss' or 'chord loss'
+        :param int origin: Index of the cell that was clicked
+        """
+        self.kind = kind
+        self.origin = origin
+        # Cells revealed by the move, including the ones opened by hitting a 0
+        self.opened = array('I')
+        # Falsely flagged cells that got their flag removed by being revealed
+        self.unflagged = array('I')
+
+
+class History:
+    """Undo and redo stacks of moves made during the current game"""
+
+    def __init__(self, on_commit: Callable[[Move], None] = None):
+        """
+        :param on_commit: Called with every finished move, including redone ones
+        """
+        self.on_commit = on_commit
+        self.undo_moves: list[Move] = []
+        self.redo_moves: list[Move] = []
+        self.current: Move | None = None
+        # Turned off while undoing, so taking a move back is not recorded as a new one
+        self.recording = True
+        # Redone moves get recorded, but keep the rest of redo stack intact
+        self.redoing = False
+
+    def begin(self, kind: str, origin: int):
+        """Start recording a new move"""
+        if self.recording:
+            self.current = Move(kind, origin)
+
+    def opened(self, index: int, was_flagged: bool):
+        """Add a revealed cell to the move being recorded"""
+        if self.current is not None:
+            self.current.opened.append(index)
+            if was_flagged:
+                self.current.unflagged.append(index)
+
+    def commit(self):
+        """Finish recording the current move. A new move makes redo impossible"""
+        if self.current is None:
+            return
+        move = self.current
+        self.undo_moves.append(move)
+        self.current = None
+        if not self.redoing:
+            self.redo_moves.clear()
+        if self.on_commit is not None:
+            self.on_commit(move)
+
+    def clear(self):
+        """Forget all moves, used when a new game starts"""
+        self.undo_moves.clear()
+        self.redo_moves.clear()
+        self.current = None
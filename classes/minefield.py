@@ -0,0 +1,21 @@
+import random
+
+
+def place_mines(cell_count: int, mines: int, rng: random.Random = random) -> bytearray:
+    """Pick mine positions by cell index, without shuffling any cell objects.
+    Dense minefields pick the safe cells instead, so at most half the cells are ever picked.
+
+    :param int cell_count: Number of cells in the minefield
+    :param int mines: Number of mines to place
+    :param random.Random rng: Source of randomness, seeded one makes minefields reproducible
+    :return bytearray: Mine map, one byte per cell index, 1 for mines and 0 for safe cells
+    """
+    if mines * 2 > cell_count:
+        mine_map = bytearray(b'\x01') * cell_count
+        for index in rng.sample(range(cell_count), cell_count - mines):
+            mine_map[index] = 0
+    else:
+        mine_map = bytearray(cell_count)
+        for index in rng.sample(range(cell_count), mines):
+            mine_map[index] = 1
+    return mine_map
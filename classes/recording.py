@@ -0,0 +1,227 @@
+import heapq
+import itertools
+from time import monotonic, sleep
+from typing import Callable
+
+
+class RecordingWidget:
+    """Stands in for a tkinter widget without needing a display.
+    Keeps its options in memory, so state can be read back with [] just like in tkinter.
+    """
+    # Values tkinter reports for options that were never set
+    defaults = {'state': 'normal'}
+    # Huge minefields have one of these per cell
+    __slots__ = ('root', 'parent', 'options', 'bindings', 'position', 'destroyed')
+
+    def __init__(self, root: "RecordingRoot", parent: "RecordingWidget", **options):
+        """
+        :param RecordingRoot root: Root window, None when creating the root itself
+        :param RecordingWidget parent: Widget this one is placed in
+        """
+        self.root = root or self
+        self.parent = parent
+        self.options = options
+        # Event handlers by sequence, created with the first one
+        self.bindings: dict[str, Callable] | None = None
+        # Column and row set by 'grid'
+        self.position: tuple[int, int] | None = None
+        self.destroyed = False
+
+    def configure(self, **options):
+        """Change widget options"""
+        self.options.update(options)
+        self.root.changed(self)
+
+    config = configure
+
+    def __getitem__(self, key: str):
+        return self.options.get(key, self.defaults.get(key, ''))
+
+    def __setitem__(self, key: str, value):
+        self.configure(**{key: value})
+
+    def grid(self, column: int = 0, row: int = 0, **options):
+        """Place widget in its parent"""
+        self.position = (column, row)
+        self.root.changed(self)
+
+    def grid_rowconfigure(self, index: int, **options):
+        """Nothing gets stretched without a display"""
+        pass
+
+    def grid_columnconfigure(self, index: int, **options):
+        """Nothing gets stretched without a display"""
+        pass
+
+    def bind(self, sequence: str, func: Callable):
+        """Keep event handler, 'event_generate' calls it"""
+        if self.bindings is None:
+            self.bindings = {}
+        self.bindings[sequence] = func
+
+    def event_generate(self, sequence: str):
+        """Call handler bound to the event, like a click on a real widget would"""
+        self.bindings[sequence](None)
+
+    def destroy(self):
+        """Mark widget as gone"""
+        self.destroyed = True
+
+    def after(self, ms: int, func: Callable, *args) -> str:
+        """Call function after given number of milliseconds"""
+        return self.root.schedule(ms, func, args)
+
+    def after_cancel(self, identifier: str):
+        """Cancel call scheduled with 'after'"""
+        self.root.cancel(identifier)
+
+
+class RecordingMenu(RecordingWidget):
+    """Menu bar stand in, entries are only stored"""
+
+    def __init__(self, root: "RecordingRoot", parent: RecordingWidget):
+        super().__init__(root, parent)
+        self.entries: list[dict] = []
+
+    def add_command(self, **options):
+        """Add menu entry"""
+        self.entries.append(options)
+
+    def index(self, index: str) -> int:
+        """Only 'end' is supported, index of the last entry"""
+        return len(self.entries) - 1
+
+    def entryconfigure(self, index: int, **options):
+        """Change menu entry"""
+        self.entries[index].update(options)
+
+
+class RecordingRoot(RecordingWidget):
+    """Root window stand in. Runs scheduled calls and optionally collects changed widgets"""
+
+    def __init__(self, track_changes: bool = False):
+        """
+        :param bool track_changes: Collect changed widgets in 'dirty', whoever draws
+            them has to clear it
+        """
+        super().__init__(None, None)
+        self.dirty: set[RecordingWidget] | None = set() if track_changes else None
+        # Scheduled calls by id, and a heap of their due times
+        self.scheduled: dict[str, tuple[Callable, tuple]] = {}
+        self.due: list[tuple[float, int, str]] = []
+        self.ids = itertools.count()
+        # Time skipped with 'advance', so tests do not have to wait for timers
+        self.skipped = 0.0
+
+    def now(self) -> float:
+        """Current time in seconds, including skipped time"""
+        return monotonic() + self.skipped
+
+    def changed(self, widget: RecordingWidget):
+        """Remember widget needs to be redrawn"""
+        if self.dirty is not None:
+            self.dirty.add(widget)
+
+    def schedule(self, ms: int, func: Callable, args: tuple) -> str:
+        """Add call to the schedule"""
+        number = next(self.ids)
+        identifier = f"after#{number}"
+        self.scheduled[identifier] = (func, args)
+        heapq.heappush(self.due, (self.now() + ms / 1000, number, identifier))
+        return identifier
+
+    def cancel(self, identifier: str):
+        """Remove call from the schedule"""
+        self.scheduled.pop(identifier, None)
+
+    def after_idle(self, func: Callable, *args) -> str:
+        """Call function as soon as possible"""
+        return self.schedule(0, func, args)
+
+    def run_due(self):
+        """Make all calls that are due"""
+        now = self.now()
+        while self.due and self.due[0][0] <= now:
+            identifier = heapq.heappop(self.due)[2]
+            call = self.scheduled.pop(identifier, None)
+            if call is not None:
+                call[0](*call[1])
+
+    def next_due(self) -> float | None:
+        """Seconds until the next scheduled call, None if there are none"""
+        if not self.due:
+            return None
+        return max(self.due[0][0] - self.now(), 0)
+
+    def advance(self, ms: int):
+        """Skip time ahead and make the calls that became due, in order"""
+        end = self.now() + ms / 1000
+        while self.due and self.due[0][0] <= end:
+            self.skipped += max(self.due[0][0] - self.now(), 0)
+            self.run_due()
+        self.skipped += max(end - self.now(), 0)
+
+    def update(self):
+        """Make calls that are due, same as processing pending events in tkinter"""
+        self.run_due()
+
+    update_idletasks = update
+
+    def mainloop(self):
+        """Run scheduled calls until destroyed"""
+        while not self.destroyed:
+            wait = self.next_due()
+            if wait is None:
+                return
+            sleep(wait)
+            self.run_due()
+
+    def wait_visibility(self):
+        """Nothing to wait for without a display"""
+        pass
+
+    def title(self, text: str):
+        self.options['title'] = text
+
+    def iconbitmap(self, file: str):
+        """No icons without a display"""
+        pass
+
+    def protocol(self, name: str, func: Callable):
+        self.bind(name, func)
+
+    def geometry(self, resolution: str):
+        self.options['geometry'] = resolution
+
+    def winfo_height(self) -> int:
+        """No pixels without a display, fonts are not used anyway"""
+        return 0
+
+
+class RecordingBackend:
+    """Creates recording widgets, same interface as 'TkBackend'.
+    Game logic can run on it without a display, much faster than with tkinter.
+    """
+    # Clicks are simulated with 'event_generate', which needs the handlers
+    events = True
+
+    def __init__(self, track_changes: bool = False):
+        """
+        :param bool track_changes: Collect changed widgets in root's 'dirty' set
+        """
+        self.track_changes = track_changes
+
+    def root(self) -> RecordingRoot:
+        return RecordingRoot(self.track_changes)
+
+    def frame(self, location: RecordingWidget, **options) -> RecordingWidget:
+        return RecordingWidget(location.root, location, **options)
+
+    def button(self, location: RecordingWidget, **options) -> RecordingWidget:
+        return RecordingWidget(location.root, location, **options)
+
+    def label(self, location: RecordingWidget, **options) -> RecordingWidget:
+        return RecordingWidget(location.root, location, **options)
+
+    def menu(self, location: RecordingWidget) -> RecordingMenu:
+        return RecordingMenu(location.root, location)
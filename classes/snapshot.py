@@ -0,0 +1,112 @@
+import os
+import struct
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from main import Game
+
+
+class Snapshot:
+    """Fixed layout binary save of a game in progress.
+
+    Little-endian header: magic, format version, width, height, mines, elapsed seconds.
+    Followed by three bitplanes of one bit per cell: mines, revealed, flagged.
+    Cell index is 'x * height + y', same order the cells are generated in.
+    """
+    file = 'savegame.bin'
+    magic = b'MSWP'
+    version = 1
+    header = struct.Struct('<4sHHHII')
+
+    def __init__(self, width: int, height: int, mines: int, elapsed: int,
+                 mine_plane: bytes, revealed_plane: bytes, flagged_plane: bytes):
+        """
+        :param int width: Cell width of the saved minefield
+        :param int height: Cell height of the saved minefield
+        :param int mines: Number of mines
+        :param int elapsed: Seconds shown on the timer
+        :param bytes mine_plane: Bit per cell, set for mines
+        :param bytes revealed_plane: Bit per cell, set for revealed cells
+        :param bytes flagged_plane: Bit per cell, set for flagged cells
+        """
+        self.width = width
+        self.height = height
+        self.mines = mines
+        self.elapsed = elapsed
+        self.mine_plane = mine_plane
+        self.revealed_plane = revealed_plane
+        self.flagged_plane = flagged_plane
+
+    @staticmethod
+    def plane_size(cell_count: int) -> int:
+        """Bytes needed to store one bit per cell"""
+        return (cell_count + 7) // 8
+
+    @staticmethod
+    def pack(bits: list[bool]) -> bytes:
+        """Pack a list of bools into a bitplane, first cell in the lowest bit"""
+        if not bits:
+            return b''
+        # Building the number from a string of digits keeps the loop in C
+        digits = ''.join('1' if bit else '0' for bit in reversed(bits))
+        return int(digits, 2).to_bytes(Snapshot.plane_size(len(bits)), 'little')
+
+    @staticmethod
+    def bit(plane: bytes, index: int) -> bool:
+        """Read a single cell's bit from a bitplane"""
+        return bool(plane[index >> 3] >> (index & 7) & 1)
+
+    @staticmethod
+    def count(plane: bytes) -> int:
+        """Number of cells with their bit set in a bitplane"""
+        return int.from_bytes(plane, 'little').bit_count()
+
+    @classmethod
+    def from_game(cls, game: "Game") -> "Snapshot":
+        """Capture the current state of every cell in the game"""
+        cells = [cell for column in game.cell_grid for cell in column]
+        return cls(
+            game.settings.cell_width,
+            game.settings.cell_height,
+            game.settings.mines,
+            game.timer.elapsed(),
+            cls.pack([cell.is_mine for cell in cells]),
+            cls.pack([cell.revealed for cell in cells]),
+            cls.pack([cell.flagged for cell in cells]),
+        )
+
+    @classmethod
+    def load(cls, path: str = file) -> "Snapshot":
+        """Read snapshot through a memory map of the file.
+        :raises ValueError: File is not a snapshot or is truncated
+        """
+        # Imported only when there is a saved game, not on every launch
+        import mmap
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < cls.header.size:
+                raise ValueError("Snapshot file is truncated")
+            magic, version, width, height, mines, elapsed = cls.header.unpack_from(mm)
+            if magic != cls.magic or version != cls.version:
+                raise ValueError("Not a snapshot file of a supported version")
+
+            size = cls.plane_size(width * height)
+            start = cls.header.size
+            if len(mm) < start + 3 * size:
+                raise ValueError("Snapshot file is truncated")
+            # Slicing the map copies each plane out in one go
+            return cls(width, height, mines, elapsed,
+                       mm[start:start + size],
+                       mm[start + size:start + 2 * size],
+                       mm[start + 2 * size:start + 3 * size])
+
+    def save(self, path: str = file):
+        """Write snapshot to file. Written to a temporary file first,
+        so an interrupted save never leaves a broken snapshot behind.
+        """
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            f.write(self.header.pack(self.magic, self.version, self.width,
+                                     self.height, self.mines, self.elapsed))
+            f.write(self.mine_plane)
+            f.write(self.revealed_plane)
+            f.write(self.flagged_plane)
+        os.replace(temporary, path)
@@ -0,0 +1,268 @@
+"""Spectator and co-op server, and a headless client for it.
+
+Runs on asyncio streams in a background thread, next to the tkinter mainloop.
+Messages are JSON, one per line:
+    board   full board, sent on connect and whenever a delta is not enough
+    reveal  flat list of revealed cell indexes and their values
+    flag    cell index and whether it is now flagged
+    tick    seconds shown on the timer
+Clients that joined as players, with the token the host got, can send 'reveal', 'flag'
+and 'chord' moves with a cell index.
+"""
+import asyncio
+import contextlib
+import hmac
+import json
+import queue
+import secrets
+import threading
+
+
+def encode(message: dict) -> bytes:
+    """Turn message into a line of compact JSON"""
+    return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+
+class BoardMirror:
+    """What spectators see of the board, kept up to date by applying messages.
+    One character per cell: '.' unrevealed, 'F' flagged, '*' mine, '0'-'8' revealed.
+    """
+    hidden = ord('.')
+    flagged = ord('F')
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.mines = 0
+        self.time = 0
+        self.status = ""
+        self.cells = bytearray()
+
+    def apply(self, message: dict):
+        """Update the board with a message from the host"""
+        kind = message['type']
+        if kind == 'board':
+            self.width = message['width']
+            self.height = message['height']
+            self.mines = message['mines']
+            self.time = message['time']
+            self.status = message['status']
+            self.cells = bytearray(message['cells'].encode())
+        elif kind == 'reveal':
+            cells = message['cells']
+            for i in range(0, len(cells), 2):
+                self.cells[cells[i]] = ord('0') + cells[i + 1]
+        elif kind == 'flag':
+            self.cells[message['cell']] = self.flagged if message['on'] else self.hidden
+        elif kind == 'tick':
+            self.time = message['time']
+
+    def board_message(self) -> dict:
+        """Full board, for clients that join late or fell behind"""
+        return {
+            'type': 'board',
+            'width': self.width,
+            'height': self.height,
+            'mines': self.mines,
+            'time': self.time,
+            'status': self.status,
+            'cells': self.cells.decode(),
+        }
+
+    def rows(self) -> list[str]:
+        """Board as text, one line per row of cells"""
+        text = self.cells.decode()
+        return [text[y::self.height] for y in range(self.height)]
+
+
+class SpectatorConnection:
+    """Outgoing message queue of a single client.
+    A client too slow to keep up gets its backlog replaced with one full board.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, backlog: int):
+        self.writer = writer
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(backlog)
+        self.player = False
+
+    def send(self, data: bytes, mirror: BoardMirror):
+        """Queue message without waiting, skipping ahead to a full board if queue is full"""
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(encode(mirror.board_message()))
+
+    async def send_loop(self):
+        """Write queued messages, waiting for slow clients to catch up"""
+        while True:
+            data = await self.queue.get()
+            self.writer.write(data)
+            await self.writer.drain()
+
+
+class SpectatorServer:
+    """Broadcasts the live game to connected clients and collects co-op moves.
+    Methods without 'async' are safe to call from the tkinter thread.
+    """
+    # Longest line accepted, big enough for full boards of huge minefields
+    line_limit = 2 ** 24
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765, backlog: int = 256,
+                 token: str = None):
+        """
+        :param str host: Address to listen on, '0.0.0.0' for the whole LAN
+        :param int port: Port to listen on, 0 picks a free one
+        :param int backlog: Messages queued per client before it gets resynchronized
+        :param str token: Players have to send it to join, a random one by default
+        """
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.token = token or secrets.token_urlsafe(8)
+        self.mirror = BoardMirror()
+        self.connections: set[SpectatorConnection] = set()
+        # Tasks serving each client, cancelled when the server stops
+        self.handlers: set[asyncio.Task] = set()
+        # Moves sent by co-op players, picked up by the game on its own thread
+        self.moves: queue.SimpleQueue[dict] = queue.SimpleQueue()
+
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.thread: threading.Thread | None = None
+        self.ready = threading.Event()
+        self.closing: asyncio.Event | None = None
+        self.error: Exception | None = None
+
+    def start(self):
+        """Start serving on a background thread.
+        :raises OSError: Address can not be used
+        """
+        self.thread = threading.Thread(target=asyncio.run, args=(self.serve(),), daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def stop(self):
+        """Disconnect everyone and stop the background thread"""
+        if self.loop is not None and self.closing is not None:
+            self.loop.call_soon_threadsafe(self.closing.set)
+            self.thread.join(1)
+
+    def publish(self, message: dict):
+        """Send message to every client. Only hands it over to the server thread,
+        so the game does not wait on encoding or on slow clients.
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.broadcast, message)
+
+    def broadcast(self, message: dict):
+        """Apply message to the mirror and queue it for every client"""
+        self.mirror.apply(message)
+        data = encode(message)
+        for connection in self.connections:
+            connection.send(data, self.mirror)
+
+    async def serve(self):
+        """Accept connections until stopped"""
+        self.loop = asyncio.get_running_loop()
+        self.closing = asyncio.Event()
+        try:
+            server = await asyncio.start_server(
+                self.handle, self.host, self.port, limit=self.line_limit)
+        except OSError as error:
+            self.error = error
+            self.ready.set()
+            return
+        # Port 0 lets the system pick, report the one actually used
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+        async with server:
+            await self.closing.wait()
+            # Disconnect clients first, newer Pythons wait for them when closing the server
+            handlers = list(self.handlers)
+            for handler in handlers:
+                handler.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve a single client: send board, then deltas, and read its moves"""
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        connection = SpectatorConnection(writer, self.backlog)
+        connection.send(encode(self.mirror.board_message()), self.mirror)
+        self.connections.add(connection)
+        sender = asyncio.create_task(connection.send_loop())
+        try:
+            async for line in reader:
+                self.receive(connection, line)
+        except (ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Server is stopping, client still gets disconnected below
+            pass
+        finally:
+            self.connections.discard(connection)
+            self.handlers.discard(handler)
+            sender.cancel()
+            # Collects the error of a failed send too, so it is not reported as never retrieved
+            await asyncio.gather(sender, return_exceptions=True)
+            writer.close()
+            with contextlib.suppress(OSError):
+                await writer.wait_closed()
+
+    def receive(self, connection: SpectatorConnection, line: bytes):
+        """Handle a message from a client. Spectators can only ask to join as players"""
+        try:
+            message = json.loads(line)
+            kind = message['type']
+        except (ValueError, TypeError, KeyError):
+            return
+        if kind == 'join':
+            # Anyone who can reach the port can watch, only those given the token can play
+            token = str(message.get('token', '')).encode()
+            connection.player = (message.get('role') == 'player'
+                                 and hmac.compare_digest(token, self.token.encode()))
+        elif kind in ('reveal', 'flag', 'chord') and connection.player:
+            if isinstance(message.get('cell'), int):
+                self.moves.put({'type': kind, 'cell': message['cell']})
+
+
+class SpectatorClient:
+    """Headless client that keeps its own copy of the board"""
+
+    def __init__(self):
+        self.mirror = BoardMirror()
+        self.received = 0
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def connect(self, host: str, port: int, token: str = None):
+        """Connect to server, joining as a co-op player if given the host's token"""
+        self.reader, self.writer = await asyncio.open_connection(
+            host, port, limit=SpectatorServer.line_limit)
+        if token is not None:
+            await self.send({'type': 'join', 'role': 'player', 'token': token})
+
+    async def send(self, message: dict):
+        """Send a message to the server"""
+        self.writer.write(encode(message))
+        await self.writer.drain()
+
+    async def receive(self) -> dict | None:
+        """Wait for the next message and apply it to the board.
+        :return dict: Message, or None once the server closed the connection
+        """
+        line = await self.reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        self.mirror.apply(message)
+        self.received += 1
+        return message
+
+    async def close(self):
+        """Disconnect from server"""
+        self.writer.close()
+        await self.writer.wait_closed()
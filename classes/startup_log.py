@@ -0,0 +1,25 @@
+from time import perf_counter
+
+
+class StartupLog:
+    """Records how long each step of the launch takes, up to the first visible frame"""
+
+    def __init__(self, start: float):
+        """
+        :param float start: perf_counter() value taken before the game's imports
+        """
+        self.start = start
+        self.last = start
+        self.steps: list[tuple[str, float]] = []
+
+    def mark(self, step: str):
+        """Save time elapsed since the previous mark under the name of the finished step"""
+        now = perf_counter()
+        self.steps.append((step, now - self.last))
+        self.last = now
+
+    def report(self) -> str:
+        """Timing breakdown of all marked steps, one per line, followed by the total"""
+        lines = [f"{step:<24}{seconds * 1000:8.1f} ms" for step, seconds in self.steps]
+        lines.append(f"{'total':<24}{(self.last - self.start) * 1000:8.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,214 @@
+"""Terminal frontend. Plays by the same Game and Cell rules as the tkinter window,
+with widgets replaced by in-memory ones that get drawn with curses.
+"""
+import curses
+from typing import TYPE_CHECKING
+from .recording import RecordingBackend, RecordingWidget
+if TYPE_CHECKING:
+    from main import Game
+
+
+class TerminalBackend(RecordingBackend):
+    """Recording widgets that also collect what changed, for the terminal to redraw"""
+    # Keys call cell methods directly, cells skip binding mouse handlers
+    events = False
+
+    def __init__(self):
+        super().__init__(track_changes=True)
+
+
+class Terminal:
+    """Draws the game with curses and turns key presses into clicks"""
+    # Screen lines taken by the status bar above the minefield
+    header_lines = 2
+    # Screen columns per cell
+    cell_columns = 2
+    # Widest and tallest minefield the terminal plays. 500x500 takes a couple of seconds
+    # to fill in and about 200 MB
+    max_cell_count = 500
+    help_text = "arrows: move  space: reveal/chord  f: flag  u/r: undo/redo  n: new  q: quit"
+    # Emoji used by the game, replaced with characters every terminal can show
+    replacements = str.maketrans({'🕸': '*', '⏱': '', '🏴': 'F'})
+    # Colors of numbers 1 to 8, close to the tkinter ones
+    number_colors = (curses.COLOR_BLUE, curses.COLOR_GREEN, curses.COLOR_RED,
+                     curses.COLOR_MAGENTA, curses.COLOR_RED, curses.COLOR_CYAN,
+                     curses.COLOR_WHITE, curses.COLOR_WHITE)
+
+    def __init__(self, game: "Game", screen: "curses.window"):
+        """
+        :param Game game: Game started with a TerminalBackend
+        :param curses.window screen: Screen from 'curses.wrapper'
+        """
+        self.game = game
+        self.screen = screen
+        # Selected cell and the top left cell of the visible part of the minefield
+        self.cursor = [0, 0]
+        self.corner = [0, 0]
+        # Minefield drawn last time, a new one means the game was restarted
+        self.minefield = None
+
+        self.colors = curses.has_colors()
+        if self.colors:
+            curses.use_default_colors()
+            for number, color in enumerate(self.number_colors, start=1):
+                curses.init_pair(number, color, -1)
+        self.screen.keypad(True)
+
+    def run(self):
+        """Draw changes and handle keys until the game is quit"""
+        root = self.game.root
+        while not root.destroyed:
+            root.run_due()
+            self.draw()
+            # Wait for keys until something is scheduled, but at most a second
+            wait = root.next_due()
+            self.screen.timeout(1000 if wait is None else int(min(wait, 1) * 1000))
+            key = self.screen.getch()
+            if key != -1:
+                self.handle(key)
+
+    def handle(self, key: int):
+        """Move cursor or play the selected cell"""
+        x, y = self.cursor
+        if key in (curses.KEY_LEFT, ord('h')):
+            self.cursor[0] = max(x - 1, 0)
+        elif key in (curses.KEY_RIGHT, ord('l')):
+            self.cursor[0] = min(x + 1, self.game.settings.cell_width - 1)
+        elif key in (curses.KEY_UP, ord('k')):
+            self.cursor[1] = max(y - 1, 0)
+        elif key in (curses.KEY_DOWN, ord('j')):
+            self.cursor[1] = min(y + 1, self.game.settings.cell_height - 1)
+        elif key in (ord(' '), ord('\n'), curses.KEY_ENTER):
+            if x < len(self.game.cell_grid):
+                cell = self.game.cell_grid[x][y]
+                # Revealed numbers chord, like a middle click in the window
+                if cell.revealed:
+                    cell.chord()
+                else:
+                    cell.left_click()
+        elif key == ord('f'):
+            if x < len(self.game.cell_grid):
+                self.game.cell_grid[x][y].right_click()
+        elif key == ord('u'):
+            self.game.undo()
+        elif key == ord('r'):
+            self.game.redo()
+        elif key == ord('n'):
+            self.game.restart()
+        elif key in (ord('q'), 27):
+            self.quit()
+        elif key == curses.KEY_RESIZE:
+            self.minefield = None
+
+    def quit(self):
+        """Save game in progress and close. Settings stay as the window version left them"""
+        self.game.save_game()
+        if self.game.server is not None:
+            self.game.server.stop()
+        self.game.root.destroy()
+
+    def visible_size(self) -> tuple[int, int]:
+        """Number of cell columns and rows that fit on screen"""
+        lines, columns = self.screen.getmaxyx()
+        return max(columns // self.cell_columns, 1), max(lines - self.header_lines, 1)
+
+    def scroll(self) -> bool:
+        """Move visible part of minefield to keep cursor on screen
+        :return bool: True if it had to move
+        """
+        moved = False
+        for axis, size in enumerate(self.visible_size()):
+            if self.cursor[axis] < self.corner[axis]:
+                self.corner[axis] = self.cursor[axis]
+                moved = True
+            elif self.cursor[axis] >= self.corner[axis] + size:
+                self.corner[axis] = self.cursor[axis] - size + 1
+                moved = True
+        return moved
+
+    def draw(self):
+        """Redraw changed cells and status bar. Everything after restart, resize or scroll"""
+        root = self.game.root
+        redraw_all = self.minefield is not self.game.minefield
+        redraw_all = self.scroll() or redraw_all
+        if redraw_all:
+            self.minefield = self.game.minefield
+            self.cursor[0] = min(self.cursor[0], self.game.settings.cell_width - 1)
+            self.cursor[1] = min(self.cursor[1], self.game.settings.cell_height - 1)
+            self.screen.erase()
+            self.draw_status()
+            columns, rows = self.visible_size()
+            for x in range(self.corner[0], min(self.corner[0] + columns, len(self.game.cell_grid))):
+                for y in range(self.corner[1], min(self.corner[1] + rows, self.game.settings.cell_height)):
+                    self.draw_cell(self.game.cell_grid[x][y].button)
+        else:
+            status_changed = False
+            for widget in root.dirty:
+                if widget.parent is self.minefield:
+                    self.draw_cell(widget)
+                else:
+                    status_changed = True
+            if status_changed:
+                self.draw_status()
+        root.dirty.clear()
+
+        self.move_cursor()
+        self.screen.noutrefresh()
+        curses.doupdate()
+
+    def draw_status(self):
+        """Mines left, game state and time, followed by key help"""
+        status = (f"{self.game.flagged_counter.unflagged_count['text']} "
+                  f"[{self.game.reset_button['text']}] "
+                  f"{self.game.timer.clock['text']}   {self.help_text}")
+        width = self.screen.getmaxyx()[1]
+        self.put(0, 0, status.translate(self.replacements)[:width - 1], curses.A_BOLD)
+        self.screen.clrtoeol()
+
+    def draw_cell(self, button: RecordingWidget):
+        """Draw a single cell, if it is placed and on screen"""
+        if button.position is None:
+            return
+        x, y = button.position
+        columns, rows = self.visible_size()
+        if not (0 <= x - self.corner[0] < columns and 0 <= y - self.corner[1] < rows):
+            return
+        symbol, attribute = self.cell_symbol(button)
+        self.put(self.header_lines + y - self.corner[1],
+                 (x - self.corner[0]) * self.cell_columns, symbol, attribute)
+
+    def cell_symbol(self, button: RecordingWidget) -> tuple[str, int]:
+        """Character and curses attribute showing what the cell button shows"""
+        text = button['text']
+        if text == "🏴":
+            # Falsely flagged mines get highlighted on loss
+            highlight = curses.A_REVERSE if button['bg'] == '#ffbdb3' else curses.A_BOLD
+            return 'F', highlight | self.color(3)
+        if text == "🕸":
+            # Mine that lost the game
+            highlight = curses.A_REVERSE if button['bg'] == '#f20000' else curses.A_BOLD
+            return '*', highlight
+        if button['relief'] == 'sunken':
+            if text:
+                return text, self.color(int(text))
+            return ' ', curses.A_NORMAL
+        return '.', curses.A_DIM
+
+    def color(self, number: int) -> int:
+        """Color attribute for a number, plain text on terminals without colors"""
+        return curses.color_pair(number) if self.colors else curses.A_NORMAL
+
+    def move_cursor(self):
+        """Put terminal cursor on the selected cell"""
+        try:
+            self.screen.move(self.header_lines + self.cursor[1] - self.corner[1],
+                             (self.cursor[0] - self.corner[0]) * self.cell_columns)
+        except curses.error:
+            pass
+
+    def put(self, line: int, column: int, text: str, attribute: int):
+        """Write text, ignoring the error curses raises for the bottom right corner"""
+        try:
+            self.screen.addstr(line, column, text, attribute)
+        except curses.error:
+            pass
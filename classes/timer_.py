@@ -1,13 +1,20 @@
-from tkinter import Label, Frame
+from tkinter import Frame
+from .backend import TkBackend
 
 class Timer:
     """Keeps track of time elapsed.
     Starts with first move and stops if you win/lose
     """
-    def __init__(self, location: Frame, font: tuple[str, int]):
+    def __init__(self, location: Frame, font: tuple[str, int], backend: TkBackend = None):
+        """
+        :param tkinter.Frame location: Top bar frame
+        :param (str, int) font: Font name and size
+        :param TkBackend backend: Creates the label, tkinter one by default
+        """
+        backend = backend or TkBackend()
         self.counter = 0
         self.updating = None
-        self.clock = Label(
+        self.clock = backend.label(
             location,
             text='⏱0000',
             font=font,
@@ -26,10 +33,22 @@ class Timer:
         self.counter += 1
         self.updating = self.clock.after(1000, self.update)
 
+    def elapsed(self) -> int:
+        """Seconds currently shown on the clock. Counter is already one ahead of it"""
+        return max(self.counter - 1, 0)
+
     def start(self):
         """Start the timer"""
         self.update()
 
     def stop(self):
         """Stop the timer"""
-        self.clock.after_cancel(self.updating)
+        if self.updating is not None:
+            self.clock.after_cancel(self.updating)
+            self.updating = None
+
+    def reset(self):
+        """Stop the timer and set it back to zero"""
+        self.stop()
+        self.counter = 0
+        self.clock.configure(text='⏱0000')
@@ -6,18 +6,54 @@ Settings are saved between games in a config.ini file,
 you can also customize said file to change fonts and difficulty
 """
 
+# Taken before any other import, so startup timing includes loading tkinter
+from time import perf_counter
+launch_time = perf_counter()
+
+import argparse
+import os
+import queue
 import random
-import sys
-from tkinter import Tk, Frame, Button, Menu
-from classes import Cell, Timer, Config, FlaggedCounter
+import struct
+from tkinter import Frame, Button
+from classes import (
+    Cell, Timer, Config, FlaggedCounter, StartupLog, Snapshot, History, Move, TkBackend,
+    place_mines)
+
+def main(show_startup_times: bool = False, serve_port: int = None, serve_host: str = '127.0.0.1',
+         seed: int = None):
+    """Simple steps to run the game
+
+    :param bool show_startup_times: Print how long each launch step took
+    :param int serve_port: Broadcast the game to spectators and co-op players on this port
+    :param str serve_host: Address the spectator server listens on
+    :param int seed: Makes mine placement the same every time the game is launched
+    """
+    startup_log = StartupLog(launch_time)
+    startup_log.mark("imports")
 
-def main():
-    """Simple steps to run the game"""
     # Create main game window with settings.
-    active_game = Game()
+    active_game = Game(startup_log, seed=seed)
 
     # Initialise the game.
     active_game.start()
+    startup_log.mark("top bar and first cells")
+
+    if serve_port is not None:
+        # Imported only when needed, asyncio takes a while to load
+        from classes.spectator import SpectatorServer
+        server = SpectatorServer(serve_host, serve_port)
+        server.start()
+        active_game.serve(server)
+        print(f"Serving spectators on {server.host}:{server.port}")
+        print(f"Co-op players join with: python spectate.py {server.port} --player {server.token}")
+
+    if show_startup_times:
+        # Waits for the window to actually get drawn. Remaining cells of big
+        # minefields keep getting added while waiting.
+        active_game.root.wait_visibility()
+        startup_log.mark("first visible frame")
+        print(startup_log.report())
 
     # Mainloop must be outside of .start(), as otherwise it will be recreated during
     # restart and leak memory.
@@ -27,17 +63,53 @@ def main():
 class Game:
     """Holds the main game logic"""
 
-    def __init__(self):
+    # Cells created before the window gets a chance to redraw.
+    # Bigger minefields are filled in over several event loop iterations.
+    fill_batch_size = 500
+    # Milliseconds between saves of a game in progress
+    autosave_interval = 5000
+    # Milliseconds between checks for co-op moves and timer changes to broadcast
+    server_poll_interval = 50
+    # Widest and tallest saved minefield that gets resumed
+    max_cell_count = Config.max_cell_count
+
+    def __init__(self, startup_log: StartupLog = None, backend: TkBackend = None,
+                 save_file: str = Snapshot.file, seed: int = None):
+        """
+        :param StartupLog startup_log: Records how long launch steps take, if given
+        :param TkBackend backend: Creates widgets the game is drawn with, tkinter by default
+        :param str save_file: Where the game in progress is saved
+        :param int seed: Seed for mine placement, games are reproducible with the same one
+        """
+        startup_log = startup_log or StartupLog(perf_counter())
+        self.backend = backend or TkBackend()
+        self.save_file = save_file
+        # Module itself works as a generator too, sharing its seed with 'random.seed'
+        self.rng = random if seed is None else random.Random(seed)
+
         # Main window is not recreated to keep window size between resets
-        self.root = Tk()
+        self.root = self.backend.root()
+        startup_log.mark("tk root")
 
         # Allows other classes to interact with main game.
         self.settings = Config(self)
         Cell.active_game = self
 
+        # Moves made this game, to undo and redo them
+        self.history = History(self.publish_move)
+
+        # Optional spectator server, see 'serve'
+        self.server = None
+        self.published_time = 0
+
+        # Continue the game that was left unfinished last time
+        self.saved_game = self.load_saved_game()
+        startup_log.mark("settings")
+
         # Modify main game window with prepared settings
         self.root_settings_varied()
         self.root_settings_basic()
+        startup_log.mark("window setup")
 
         # Declare future variables
         self.cell_grid: list[list[Cell]]
@@ -54,13 +126,21 @@ class Game:
         # End game condition. Hitting 0 ends the game.
         self.unrevealed_cell_count: int
 
+        # Pending 'after' call that adds the next batch of cells to the minefield
+        self.filling = None
+
+        # Periodically save the game in progress, in case it gets closed unexpectedly
+        self.root.after(self.autosave_interval, self.autosave)
+
     def start(self):
         """ Start or restart the game.
         Creates everything unique per game.
         Sets Cell behavior to starting value. 
         """
-        Cell.left_click = Cell.first_move
+        # Left click gets enabled once the whole minefield is populated
+        Cell.left_click = Cell.disabled
         Cell.right_click = Cell.flag
+        self.history.clear()
 
         # Top Bar Creation and population
         self.unrevealed_cell_count = self.settings.unrevealed_cell_count()
@@ -68,22 +148,21 @@ class Game:
         self.flagged_counter = FlaggedCounter(
             self.top_bar,
             self.settings.mines,
-            (self.settings.scoreboard_font, self.settings.font_size)
+            (self.settings.scoreboard_font, self.settings.font_size),
+            self.backend
         )
         self.timer = Timer(
-            self.top_bar, (self.settings.scoreboard_font, self.settings.font_size))
+            self.top_bar, (self.settings.scoreboard_font, self.settings.font_size), self.backend)
         self.create_reset_button()
 
         # Minefield creation and population
         self.create_minefield()
+        self.cell_grid = []
+        self.not_mines = []
         self.generate_cells()
-        self.generate_mines()
 
     def root_settings_basic(self):
         """Basic settings for root window, only executed at launch"""
-        # Increase recursion limit for those huge games with not that many mines
-        sys.setrecursionlimit(2000)
-
         self.root.title("Minesweeper")
 
         # Creating menu bar before icon. 
@@ -97,6 +176,9 @@ class Game:
         self.root.bind("<Escape>", self.save_and_exit)
         self.root.protocol("WM_DELETE_WINDOW", self.save_and_exit)
 
+        self.root.bind("<Control-z>", self.undo)
+        self.root.bind("<Control-y>", self.redo)
+
         # Make scoreboard frame resizable
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
@@ -111,7 +193,7 @@ class Game:
 
     def create_difficulty_menubar(self):
         """Create menubar that lets you select difficulty"""
-        menubar = Menu(self.root)
+        menubar = self.backend.menu(self.root)
         menubar.add_command(label='Beginner 9x9',
                             command=lambda: self.settings.change_difficulty(9, 9, 10))
         menubar.add_command(label='Intermediate 16x16',
@@ -120,16 +202,69 @@ class Game:
                             command=lambda: self.settings.change_difficulty(30, 16, 99))
         menubar.add_command(label='Custom',
                             command=lambda: self.settings.custom_settings_popup(self.root))
-        self.root['menu'] = menubar
+        menubar.add_command(label=self.practice_label(), command=self.toggle_practice)
+        self.practice_entry = menubar.index('end')
+        self.root['menu'] = self.menubar = menubar
+
+    def practice_label(self) -> str:
+        """Menu label showing if practice mode is on"""
+        return f"Practice: {'On' if self.settings.practice else 'Off'}"
+
+    def toggle_practice(self):
+        """Turn practice mode on or off. It lets you undo the move that lost the game"""
+        self.settings.practice = not self.settings.practice
+        self.menubar.entryconfigure(self.practice_entry, label=self.practice_label())
 
     def save_and_exit(self, event=None):
-        """Save settings before exiting game"""
+        """Save settings and the game in progress before exiting game"""
         self.settings.save_config()
+        self.save_game()
+        if self.server is not None:
+            self.server.stop()
         self.root.destroy()
 
+    def save_game(self):
+        """Save a snapshot of the game in progress.
+        Games that are over or not yet started remove the old snapshot instead.
+        A snapshot still waiting to be resumed, while its minefield is filled in, is kept.
+        """
+        if self.saved_game is not None:
+            return
+        if Cell.left_click == Cell.regular_move:
+            Snapshot.from_game(self).save(self.save_file)
+        elif os.path.exists(self.save_file):
+            os.remove(self.save_file)
+
+    def autosave(self):
+        """Save the game in progress every few seconds"""
+        self.save_game()
+        self.root.after(self.autosave_interval, self.autosave)
+
+    def load_saved_game(self) -> Snapshot | None:
+        """Load the unfinished game's snapshot and switch settings to its minefield.
+        :return Snapshot: Saved game, or None if there is no valid one
+        """
+        if not os.path.exists(self.save_file):
+            return None
+        try:
+            snapshot = Snapshot.load(self.save_file)
+        except (OSError, ValueError, struct.error):
+            return None
+        # Header can be intact while its numbers are not, and such a game could never be won
+        if not (Config.min_cell_count <= snapshot.width <= self.max_cell_count
+                and Config.min_cell_count <= snapshot.height <= self.max_cell_count
+                and 0 < snapshot.mines < snapshot.width * snapshot.height
+                and Snapshot.count(snapshot.mine_plane) == snapshot.mines):
+            return None
+        self.settings.cell_width = snapshot.width
+        self.settings.cell_height = snapshot.height
+        self.settings.mines = snapshot.mines
+        self.settings.resolution = self.settings.calculate_resolution()
+        return snapshot
+
     def create_top_bar(self):
         """Creates top bar that holds mines left counter, restart button and timer"""
-        self.top_bar = Frame(self.root, bd=6, relief="groove")
+        self.top_bar = self.backend.frame(self.root, bd=6, relief="groove")
 
         # Make top bar resizable
         self.top_bar.grid(column=0, row=0, sticky="EWNS")
@@ -140,7 +275,7 @@ class Game:
 
     def create_minefield(self):
         """Field where the main portion of the game takes place"""
-        self.minefield = Frame(self.root, bd=6, relief="groove")
+        self.minefield = self.backend.frame(self.root, bd=6, relief="groove")
         self.minefield.grid(column=0, row=1, sticky="EWNS")
 
         # Make Buttons resizable
@@ -151,7 +286,7 @@ class Game:
 
     def create_reset_button(self):
         """Create button that resets the game without changing window size"""
-        self.reset_button = Button(
+        self.reset_button = self.backend.button(
             self.top_bar,
             text="RESET",
             font=(self.settings.scoreboard_font, self.settings.font_size),
@@ -161,6 +296,14 @@ class Game:
 
     def restart(self):
         """Restarts the game without changing settings"""
+        # Stop filling in the old minefield
+        if self.filling is not None:
+            self.root.after_cancel(self.filling)
+            self.filling = None
+        # New game was asked for, do not resume the saved one once filled in
+        self.saved_game = None
+        # Stop the clock, otherwise it keeps ticking on a label that no longer exists
+        self.timer.stop()
         self.top_bar.destroy()
         self.minefield.destroy()
         self.start()
@@ -170,14 +313,19 @@ class Game:
         self.settings.recalculate_font()
         self.restart()
 
-    def generate_cells(self):
+    def generate_cells(self, first_column: int = 0):
         """Populates play field with Cells that contain buttons and attributes.
         Store them all in a grid shape list to check neighboring mines later.
-        And in a basic list for mine generation"""
-        self.cell_grid = []
-        self.not_mines = []
+        And in a basic list for mine generation.
+
+        Cells are added a batch of columns at a time, letting the window show up
+        before huge minefields are complete. Mines are placed after the last batch.
+        :param int first_column: Column the current batch starts from
+        """
+        batch_columns = max(1, self.fill_batch_size // self.settings.cell_height)
+        last_column = min(first_column + batch_columns, self.settings.cell_width)
 
-        for x in range(self.settings.cell_width):
+        for x in range(first_column, last_column):
             column = []
             for y in range(self.settings.cell_height):
                 new_cell = Cell(self.minefield, (x, y))
@@ -186,17 +334,267 @@ class Game:
                 self.not_mines.append(new_cell)
             self.cell_grid.append(column)
 
+        if last_column < self.settings.cell_width:
+            # Short delay instead of 0 lets the window redraw between batches
+            self.filling = self.root.after(1, self.generate_cells, last_column)
+        else:
+            self.filling = None
+            if self.saved_game is not None:
+                self.resume_saved_game()
+            else:
+                self.generate_mines()
+                Cell.left_click = Cell.first_move
+            self.publish_board()
+
     def generate_mines(self):
         """Make cells into mines and save them to a lists. Mine list will be used during
         win/loss to highlight unrevealed and unmarked mines.
         Recreate list of not mines to calculate their values and move a mine on first move.
         """
-        self.all_mines = random.sample(self.not_mines, self.settings.mines)
+        # Holds every cell at this point, in the same order as mine map indexes
+        cells = self.not_mines
+        mine_map = place_mines(len(cells), self.settings.mines, self.rng)
+
+        self.all_mines = []
+        self.not_mines = []
+        for cell, is_mine in zip(cells, mine_map):
+            if is_mine:
+                cell.is_mine = True
+                self.all_mines.append(cell)
+            else:
+                self.not_mines.append(cell)
+
+    def resume_saved_game(self):
+        """Rebuild minefield straight from the saved snapshot's bitplanes.
+        Snapshot is only used once, restarting afterwards starts a new game.
+        """
+        snapshot = self.saved_game
+        self.saved_game = None
+        if (snapshot.width, snapshot.height, snapshot.mines) != (
+                self.settings.cell_width, self.settings.cell_height, self.settings.mines):
+            # Settings were changed before the minefield was done, start a new game
+            self.generate_mines()
+            Cell.left_click = Cell.first_move
+            return
+
+        cells = [cell for column in self.cell_grid for cell in column]
+        self.all_mines = []
+        self.not_mines = []
+        for index, cell in enumerate(cells):
+            cell.is_mine = Snapshot.bit(snapshot.mine_plane, index)
+            if cell.is_mine:
+                self.all_mines.append(cell)
+            else:
+                self.not_mines.append(cell)
+        self.cell_value()
+
+        for index, cell in enumerate(cells):
+            # Player can flag cells while the minefield is filled in, so flags are
+            # set to match the snapshot instead of toggled
+            if Snapshot.bit(snapshot.revealed_plane, index):
+                if cell.flagged:
+                    cell.flag()
+                cell.show_revealed()
+                cell.revealed = True
+                cell.left_click = cell.disabled
+                cell.right_click = cell.disabled
+                self.unrevealed_cell_count -= 1
+            elif Snapshot.bit(snapshot.flagged_plane, index) and not cell.flagged:
+                cell.flag()
+
+        Cell.left_click = Cell.regular_move
+        self.timer.counter = snapshot.elapsed
+        self.timer.start()
+        # Restoring flags is not a move that can be taken back
+        self.history.clear()
+
+    def cell_index(self, cell: Cell) -> int:
+        """Position of the cell when the grid is read column by column"""
+        x, y = cell.coordinates
+        return x * self.settings.cell_height + y
+
+    def cell_at(self, index: int) -> Cell:
+        """Look up a cell by its index, the opposite of 'cell_index'"""
+        return self.cell_grid[index // self.settings.cell_height][index % self.settings.cell_height]
+
+    def in_progress(self) -> bool:
+        """Game has all cells placed and is not over yet"""
+        return Cell.left_click in (Cell.first_move, Cell.regular_move)
+
+    def undo(self, event=None):
+        """Take back the last move. Move that lost the game can only be
+        taken back in practice mode, a won game stays won.
+        """
+        if not self.history.undo_moves:
+            return
+        move = self.history.undo_moves[-1]
+        if not (self.in_progress() or move.kind in Move.losing_kinds and self.settings.practice):
+            return
+        self.history.undo_moves.pop()
+
+        self.history.recording = False
+        if move.kind == 'flag':
+            self.cell_at(move.origin).flag()
+        elif move.kind in Move.losing_kinds:
+            self.take_back_loss()
+        else:
+            self.take_back_reveal(move)
+        self.history.recording = True
+        self.history.redo_moves.append(move)
+        self.publish_board()
+
+    def redo(self, event=None):
+        """Make the last taken back move again"""
+        if not self.history.redo_moves or not self.in_progress():
+            return
+        move = self.history.redo_moves.pop()
+        cell = self.cell_at(move.origin)
+
+        self.history.redoing = True
+        if move.kind == 'first':
+            cell.first_move()
+        elif move.kind == 'flag':
+            cell.flag()
+        elif move.kind in ('chord', 'chord loss'):
+            cell.chord()
+        else:
+            cell.regular_move()
+        self.history.redoing = False
+
+    def take_back_reveal(self, move: Move):
+        """Hide cells opened by the move and put back flags it removed.
+        A mine moved away from the first click stays moved, so redo opens the same cells.
+        """
+        for index in move.opened:
+            self.cell_at(index).hide()
+        self.unrevealed_cell_count += len(move.opened)
+        for index in move.unflagged:
+            self.cell_at(index).flag()
+        self.flagged_counter.update()
+
+        if move.kind == 'first':
+            Cell.left_click = Cell.first_move
+            self.timer.reset()
+
+    def take_back_loss(self):
+        """Hide mines revealed by loss, reactivate controls and continue the timer"""
+        # Cells share the default background color with the reset button
+        background = self.reset_button['bg']
         for mine in self.all_mines:
-            mine.is_mine = True
+            if not mine.flagged:
+                # Also clears the highlight of mines that were hit
+                mine.show_hidden()
+                mine.button.configure(bg=background)
+        for not_mine in self.not_mines:
+            if not_mine.flagged:
+                not_mine.button.configure(bg=background)
+            elif not not_mine.revealed:
+                not_mine.button.configure(state='normal')
+
+        Cell.left_click = Cell.regular_move
+        Cell.right_click = Cell.flag
+        self.reset_button.configure(text="RESET")
+        self.timer.start()
 
-        # Remove created mines from list
-        self.not_mines = [cell for cell in self.not_mines if not cell.is_mine]
+    def serve(self, server):
+        """Broadcast this game through a running spectator server
+        and play moves sent by co-op players.
+        :param classes.spectator.SpectatorServer server: Server already started
+        """
+        self.server = server
+        if self.filling is None:
+            self.publish_board()
+        self.root.after(self.server_poll_interval, self.poll_server)
+
+    def poll_server(self):
+        """Play queued co-op moves and broadcast timer changes"""
+        while True:
+            try:
+                message = self.server.moves.get_nowait()
+            except queue.Empty:
+                break
+            cell_count = self.settings.cell_width * self.settings.cell_height
+            # Moves sent while minefield is incomplete or for cells that do not exist are dropped
+            if self.filling is None and 0 <= message['cell'] < cell_count:
+                cell = self.cell_at(message['cell'])
+                if message['type'] == 'reveal':
+                    cell.left_click()
+                elif message['type'] == 'chord':
+                    cell.chord()
+                else:
+                    cell.right_click()
+
+        if self.timer.elapsed() != self.published_time:
+            self.published_time = self.timer.elapsed()
+            self.server.publish({'type': 'tick', 'time': self.published_time})
+        self.root.after(self.server_poll_interval, self.poll_server)
+
+    def publish_move(self, move: Move):
+        """Broadcast cells changed by a move"""
+        if self.server is None:
+            return
+        if move.kind == 'flag':
+            self.server.publish({
+                'type': 'flag',
+                'cell': move.origin,
+                'on': self.cell_at(move.origin).flagged,
+            })
+        elif move.opened:
+            cells = []
+            for index in move.opened:
+                cells += (index, self.cell_at(index).value)
+            self.server.publish({'type': 'reveal', 'cells': cells})
+
+    def publish_board(self):
+        """Broadcast the whole board, as it is shown to the player"""
+        if self.server is None:
+            return
+        symbols = []
+        for column in self.cell_grid:
+            for cell in column:
+                if cell.revealed:
+                    symbols.append(str(cell.value))
+                elif cell.button['text'] == "🏴":
+                    symbols.append('F')
+                elif cell.button['text'] == "🕸":
+                    symbols.append('*')
+                else:
+                    symbols.append('.')
+        self.server.publish({
+            'type': 'board',
+            'width': self.settings.cell_width,
+            'height': self.settings.cell_height,
+            'mines': self.settings.mines,
+            'time': self.timer.elapsed(),
+            'status': self.reset_button['text'],
+            'cells': ''.join(symbols),
+        })
+
+    def flood(self, cells: list[Cell]) -> list[Cell]:
+        """Find every cell opened by revealing the given ones: those cells, plus neighbors
+        of any 0 (black space) among them, repeated for every new 0 found.
+        Uses a list instead of recursion, so huge boards do not hit the recursion limit.
+        Only finds the cells, nothing is revealed yet.
+        """
+        found = set(cells)
+        to_open = list(cells)
+        i = 0
+        while i < len(to_open):
+            cell = to_open[i]
+            i += 1
+            if cell.value == 0:
+                for neighbor in self.find_neighbors(cell):
+                    if not neighbor.revealed and neighbor not in found:
+                        found.add(neighbor)
+                        to_open.append(neighbor)
+        return to_open
+
+    def open_cells(self, cells: list[Cell]):
+        """Reveal cells found by 'flood' and check victory once all of them are open"""
+        for cell in cells:
+            cell.open()
+        if self.unrevealed_cell_count == 0:
+            self.victory()
 
     def find_neighbors(self, cell: Cell):
         """Return list of cell's neighbors while filtering out cells beyond the edge"""
@@ -262,7 +660,17 @@ class Game:
         self.timer.stop()
         Cell.left_click = Cell.disabled
         Cell.right_click = Cell.disabled
+        self.publish_board()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Game of Minesweeper")
+    parser.add_argument("--startup-times", action="store_true",
+                        help="print how long each launch step took")
+    parser.add_argument("--serve", type=int, metavar="PORT",
+                        help="broadcast the game to spectators and co-op players")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to serve on, 0.0.0.0 to allow the whole LAN")
+    parser.add_argument("--seed", type=int, help="place mines the same way every launch")
+    args = parser.parse_args()
+    main(args.startup_times, args.serve, args.host, args.seed)
@@ -0,0 +1,37 @@
+"""Time mine placement on big minefields.
+Fails if the biggest one takes longer than the limit, 1 second by default.
+    python minefield_benchmark.py --limit 0.5
+"""
+import argparse
+import random
+import sys
+from time import perf_counter
+from classes import place_mines
+
+# Width, height and mines of each minefield timed
+MINEFIELDS = ((100, 100, 2_000), (1000, 1000, 200_000), (1000, 1000, 800_000))
+
+
+def time_placement(width: int, height: int, mines: int, repeats: int) -> float:
+    """Best time out of several placements, in seconds"""
+    rng = random.Random(0)
+    best = float('inf')
+    for _ in range(repeats):
+        start = perf_counter()
+        place_mines(width * height, mines, rng)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mine placement benchmark")
+    parser.add_argument("--limit", type=float, default=1.0, help="seconds allowed per minefield")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    slow = False
+    for width, height, mines in MINEFIELDS:
+        seconds = time_placement(width, height, mines, args.repeats)
+        slow = slow or seconds > args.limit
+        print(f"{width}x{height} with {mines} mines: {seconds * 1000:8.1f} ms")
+    sys.exit(1 if slow else 0)
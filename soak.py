@@ -0,0 +1,102 @@
+"""Check that restarting the game over and over does not leak memory.
+
+Performs thousands of restarts and difficulty changes, recording tracemalloc snapshots
+and the number of Tcl commands at intervals. Fails if either grows past a threshold,
+printing where the extra memory was allocated.
+Needs a display, use a virtual one on headless machines:
+    xvfb-run python soak.py
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from main import Game
+
+DIFFICULTIES = ((9, 9, 10), (16, 16, 40), (30, 16, 99))
+
+
+def play_a_little(game: Game):
+    """Make a few moves, so restarts also have a running timer, flags and history to clean up"""
+    cells = [cell for column in game.cell_grid for cell in column]
+    random.choice(cells).left_click()
+    random.choice(cells).right_click()
+    # Might hit a mine, which is fine, losing has to clean up as well
+    random.choice(cells).left_click()
+
+
+def tcl_command_count(game: Game) -> int:
+    """Number of commands in the Tcl interpreter, widgets and Python callbacks included"""
+    return len(game.root.tk.splitlist(game.root.tk.call('info', 'commands')))
+
+
+def traced_snapshot() -> tracemalloc.Snapshot:
+    """Memory snapshot without tracemalloc's own allocations.
+    Collects garbage first, cells and their button bindings reference each other.
+    """
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, tracemalloc.__file__),))
+
+
+def soak(cycles: int = 2000, interval: int = 100, warmup: int = 50,
+         memory_limit: int = 256 * 1024, command_limit: int = 20) -> bool:
+    """Restart the game 'cycles' times, changing difficulty every 10th time.
+    :param int interval: Restarts between progress reports
+    :param int warmup: Restarts before the baseline is taken, caches fill up during those
+    :param int memory_limit: Bytes traced memory may grow by after warmup
+    :param int command_limit: Tcl commands that may be added after warmup
+    :return bool: True if growth stayed within limits
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        game = Game(save_file=os.path.join(folder, 'savegame.bin'))
+        game.start()
+        tracemalloc.start(10)
+        baseline = baseline_commands = None
+
+        for cycle in range(1, cycles + 1):
+            if cycle % 10 == 0:
+                game.settings.change_difficulty(*DIFFICULTIES[cycle // 10 % len(DIFFICULTIES)])
+            else:
+                play_a_little(game)
+                game.restart()
+            game.root.update()
+
+            if cycle == warmup:
+                baseline = traced_snapshot()
+                baseline_commands = tcl_command_count(game)
+            if cycle % interval == 0:
+                traced = sum(stat.size for stat in traced_snapshot().statistics('filename'))
+                print(f"{cycle:>7} restarts {traced / 1024:>10.1f} KiB traced "
+                      f"{tcl_command_count(game):>7} Tcl commands")
+
+        final = traced_snapshot()
+        final_commands = tcl_command_count(game)
+        tracemalloc.stop()
+        game.root.destroy()
+
+    differences = final.compare_to(baseline, 'lineno')
+    growth = sum(difference.size_diff for difference in differences)
+    command_growth = final_commands - baseline_commands
+    print(f"\nGrowth after warmup: {growth / 1024:.1f} KiB, {command_growth} Tcl commands")
+    print("Top allocation sites:")
+    for difference in differences[:10]:
+        print(f"  {difference}")
+
+    passed = growth <= memory_limit and command_growth <= command_limit
+    print("PASSED" if passed else "FAILED: growth over the limit")
+    return passed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Restart memory leak soak test")
+    parser.add_argument("--cycles", type=int, default=2000)
+    parser.add_argument("--interval", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--memory-limit", type=int, default=256, help="KiB")
+    parser.add_argument("--command-limit", type=int, default=20)
+    args = parser.parse_args()
+    sys.exit(0 if soak(args.cycles, args.interval, args.warmup,
+                       args.memory_limit * 1024, args.command_limit) else 1)
@@ -0,0 +1,75 @@
+"""Watch a game hosted with 'python main.py --serve PORT' from the console.
+The board gets printed every time it changes.
+
+Join with --player and the token the host printed to play along: type 'r X Y' to reveal, 'f X Y' to flag or 'c X Y' to
+chord a cell, X and Y counting from 0 at the top left corner.
+"""
+import argparse
+import asyncio
+import contextlib
+import sys
+import threading
+from classes.spectator import SpectatorClient, BoardMirror
+
+
+def show(mirror: BoardMirror):
+    """Print board with mines left, status and time"""
+    print(f"\n{mirror.status}  mines: {mirror.mines}  time: {mirror.time}")
+    for row in mirror.rows():
+        print(' '.join(row))
+
+
+def read_lines(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue):
+    """Hand typed lines over to the event loop, None once input ends.
+    Runs on a daemon thread, so waiting for input does not keep the spectator open
+    after the host is gone.
+    """
+    for line in sys.stdin:
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(lines.put_nowait, line)
+    with contextlib.suppress(RuntimeError):
+        loop.call_soon_threadsafe(lines.put_nowait, None)
+
+
+async def read_moves(client: SpectatorClient):
+    """Send moves typed by the player. Ctrl+D leaves the game"""
+    lines: asyncio.Queue[str | None] = asyncio.Queue()
+    threading.Thread(target=read_lines, args=(asyncio.get_running_loop(), lines),
+                     daemon=True).start()
+    kinds = {'r': 'reveal', 'f': 'flag', 'c': 'chord'}
+    mirror = client.mirror
+    while (line := await lines.get()) is not None:
+        try:
+            kind, x, y = line.split()
+            x, y = int(x), int(y)
+        except ValueError:
+            kind = None
+        if kind not in kinds:
+            print("Type 'r X Y' to reveal, 'f X Y' to flag or 'c X Y' to chord")
+        elif not (0 <= x < mirror.width and 0 <= y < mirror.height):
+            print(f"X goes from 0 to {mirror.width - 1} and Y from 0 to {mirror.height - 1}")
+        else:
+            await client.send({'type': kinds[kind], 'cell': x * mirror.height + y})
+    await client.close()
+
+
+async def watch(host: str, port: int, token: str):
+    """Follow the game until the host closes it"""
+    client = SpectatorClient()
+    await client.connect(host, port, token)
+    if token is not None:
+        asyncio.create_task(read_moves(client))
+    while (message := await client.receive()) is not None:
+        # Time is shown with the next change, instead of reprinting the board every second
+        if message['type'] != 'tick':
+            show(client.mirror)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minesweeper spectator")
+    parser.add_argument("port", type=int)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--player", metavar="TOKEN",
+                        help="join as a co-op player with the token printed by the host")
+    args = parser.parse_args()
+    asyncio.run(watch(args.host, args.port, args.player))
@@ -0,0 +1,127 @@
+"""Check that broadcasting to many spectators does not slow down the host.
+
+Connects hundreds of headless spectators to a local server, some of them too slow
+to keep up. Then a 'host' thread plays a real game served through that server,
+the same way the window does, only with the recording backend instead of tkinter.
+Prints how long each click takes on the host, publishing included, compared to
+having no spectators at all.
+Spectators run in the same process, so the numbers are if anything a little worse
+than with spectators on other machines.
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from main import Game
+from classes import Cell
+from classes.recording import RecordingBackend
+from classes.spectator import SpectatorServer, SpectatorClient
+
+WIDTH = 30
+HEIGHT = 16
+MINES = 99
+# Timer never shows a negative time, it tells spectators the test is over
+FINISHED = -1
+
+
+def play_moves(server: SpectatorServer, moves: int, interval: float) -> list[float]:
+    """Reveal random safe cells on a served game, starting a new one after every win.
+    :return list[float]: Seconds each click took, including handing changes to the server
+    """
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as folder:
+        game = Game(backend=RecordingBackend(), save_file=os.path.join(folder, 'save.bin'), seed=0)
+        game.settings.cell_width = WIDTH
+        game.settings.cell_height = HEIGHT
+        game.settings.mines = MINES
+        game.start()
+        game.serve(server)
+
+        durations = []
+        for _ in range(moves):
+            if Cell.left_click == Cell.first_move:
+                cell = rng.choice(game.not_mines)
+            elif game.in_progress():
+                cell = rng.choice([cell for cell in game.not_mines if not cell.revealed])
+            else:
+                game.restart()
+                continue
+            start = time.perf_counter()
+            cell.left_click()
+            durations.append(time.perf_counter() - start)
+            # Timer ticks and co-op polling, like the window's event loop
+            game.root.run_due()
+            time.sleep(interval)
+
+        server.publish({'type': 'tick', 'time': FINISHED})
+        game.root.destroy()
+    return durations
+
+
+async def follow(client: SpectatorClient, delay: float):
+    """Read messages until the test is over, sleeping after each to simulate slow links"""
+    while client.mirror.time != FINISHED:
+        if await client.receive() is None:
+            return
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def run(spectators: int, slow: int, moves: int, interval: float) -> list[float]:
+    """Host a game for the given number of spectators.
+    :return list[float]: Seconds each click took
+    """
+    server = SpectatorServer(port=0, backlog=64)
+    server.start()
+
+    clients = [SpectatorClient() for _ in range(spectators)]
+    await asyncio.gather(*(client.connect('127.0.0.1', server.port) for client in clients))
+    followers = [
+        asyncio.create_task(follow(client, 0.01 if i < slow else 0))
+        for i, client in enumerate(clients)
+    ]
+
+    durations = await asyncio.to_thread(play_moves, server, moves, interval)
+    delivery_start = time.perf_counter()
+    await asyncio.wait_for(asyncio.gather(*followers), 60)
+    if clients:
+        print(f"  every spectator up to date {time.perf_counter() - delivery_start:.3f}s after last move")
+        print(f"  messages received: {min(c.received for c in clients)} to "
+              f"{max(c.received for c in clients)} per spectator")
+
+    for client in clients:
+        await client.close()
+    server.stop()
+    return durations
+
+
+def p99(durations: list[float]) -> float:
+    """99th percentile of the durations"""
+    durations = sorted(durations)
+    return durations[max(int(len(durations) * 0.99) - 1, 0)]
+
+
+def report(name: str, durations: list[float]):
+    """Print host side cost of clicks"""
+    print(f"  {name}: mean {statistics.mean(durations) * 1e6:.1f}us, "
+          f"p99 {p99(durations) * 1e6:.1f}us, max {max(durations) * 1e6:.1f}us per click")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Spectator server load test")
+    parser.add_argument("--spectators", type=int, default=300)
+    parser.add_argument("--slow", type=int, default=30, help="spectators that fall behind")
+    parser.add_argument("--moves", type=int, default=500)
+    parser.add_argument("--interval", type=float, default=0.002, help="seconds between moves")
+    args = parser.parse_args()
+
+    print("No spectators:")
+    baseline = asyncio.run(run(0, 0, args.moves, args.interval))
+    report("host", baseline)
+    print(f"{args.spectators} spectators, {args.slow} of them slow:")
+    loaded = asyncio.run(run(args.spectators, args.slow, args.moves, args.interval))
+    report("host", loaded)
+    print(f"  p99 is {p99(loaded) / p99(baseline):.1f}x the baseline")
@@ -0,0 +1,44 @@
+"""Play Minesweeper in a terminal, over SSH for example.
+Same rules as main.py, but minefields can be far bigger than the window can fit.
+Run with no size to use the window version's settings, or to continue a saved game.
+"""
+import argparse
+import curses
+from main import Game
+from classes import Config
+from classes.terminal import Terminal, TerminalBackend
+
+
+class TerminalGame(Game):
+    """Game that also resumes saved minefields too big for the window"""
+    max_cell_count = Terminal.max_cell_count
+
+
+def play(screen: "curses.window", width: int, height: int, mines: int, seed: int):
+    """Start the game and hand it over to the terminal"""
+    game = TerminalGame(backend=TerminalBackend(), save_file='savegame_terminal.bin', seed=seed)
+    if width is not None:
+        # Differs from a saved game's minefield, so it starts a new game instead
+        game.settings.cell_width = width
+        game.settings.cell_height = height
+        game.settings.mines = mines
+    game.start()
+    Terminal(game, screen).run()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Minesweeper in the terminal")
+    parser.add_argument("size", nargs='*', type=int, metavar="WIDTH HEIGHT MINES",
+                        help="minefield width, height and number of mines")
+    parser.add_argument("--seed", type=int, help="place mines the same way every launch")
+    args = parser.parse_args()
+    if args.size and len(args.size) != 3:
+        parser.error("give width, height and mines, or nothing")
+    width, height, mines = args.size or (None, None, None)
+    if width is not None and not (Config.min_cell_count <= min(width, height)
+                                  and max(width, height) <= Terminal.max_cell_count):
+        parser.error(f"width and height go from {Config.min_cell_count} "
+                     f"to {Terminal.max_cell_count}")
+    if width is not None and not 0 < mines < width * height:
+        parser.error("minefield needs at least one mine and one cell that is not a mine")
+    curses.wrapper(play, width, height, mines, args.seed)
@@ -0,0 +1,22 @@
+import pytest
+import tkinter as tk
+from tkinter import Button, Frame, Label, Menu
+from classes import TkBackend
+
+
+@pytest.fixture
+def root():
+    try:
+        root = TkBackend().root()
+    except tk.TclError:
+        pytest.skip("Tk needs a display")
+    yield root
+    root.destroy()
+
+def test_widgets(root: tk.Tk):
+    backend = TkBackend()
+    frame = backend.frame(root, bd=6)
+    assert isinstance(frame, Frame)
+    assert isinstance(backend.button(frame, text="RESET"), Button)
+    assert isinstance(backend.label(frame, text="00"), Label)
+    assert isinstance(backend.menu(root), Menu)
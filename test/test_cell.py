@@ -1,12 +1,12 @@
 import pytest
-import tkinter as tk
-from tkinter import Button, Frame
-from classes import Cell 
+from classes import Cell
+from classes.recording import RecordingBackend, RecordingWidget
 
 # Mock Game class
 class MockGame:
     def __init__(self):
         self.settings = MockSettings()
+        self.backend = RecordingBackend()
 
 class MockSettings:
     cell_font = 'Arial'
@@ -14,8 +14,8 @@ class MockSettings:
 
 @pytest.fixture
 def cell_instance():
-    root = tk.Tk()
-    location = Frame(root)
+    root = RecordingBackend().root()
+    location = RecordingBackend().frame(root)
     coordinates = (0, 0)
     Cell.active_game = MockGame()
     cell = Cell(location, coordinates)
@@ -28,6 +28,6 @@ def test_initialization(cell_instance: Cell):
     assert not cell_instance.revealed
     assert cell_instance.value == 0
     assert cell_instance.coordinates == (0, 0)
-    assert isinstance(cell_instance.button, Button)
+    assert isinstance(cell_instance.button, RecordingWidget)
 
 
@@ -1,21 +1,21 @@
 import pytest
-import tkinter as tk
-from tkinter import Label, Frame
 from classes import FlaggedCounter
+from classes.recording import RecordingBackend, RecordingWidget
 
 @pytest.fixture
 def flagged_counter_instance():
-    root = tk.Tk()
-    location = Frame(root)
+    backend = RecordingBackend()
+    root = backend.root()
+    location = backend.frame(root)
     mines = 10
     font = ('Arial', 12)
-    flagged_counter = FlaggedCounter(location, mines, font)
+    flagged_counter = FlaggedCounter(location, mines, font, backend)
     yield flagged_counter
     root.destroy()
 
 def test_initialization(flagged_counter_instance: FlaggedCounter):
     assert flagged_counter_instance.counter == 10
-    assert isinstance(flagged_counter_instance.unflagged_count, Label)
+    assert isinstance(flagged_counter_instance.unflagged_count, RecordingWidget)
     assert flagged_counter_instance.unflagged_count['text'] == "10🕸"
 
 def test_update(flagged_counter_instance: FlaggedCounter):
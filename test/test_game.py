@@ -1,13 +1,15 @@
 import pytest
+import os
 import random
 from main import Game
-from classes import Cell
+from classes import Cell, Snapshot
+from classes.recording import RecordingBackend
 
 
 @pytest.fixture
-def game_instance():
+def game_instance(tmp_path):
     random.seed(0)
-    active_game = Game()
+    active_game = Game(backend=RecordingBackend(), save_file=str(tmp_path / 'save.bin'))
     active_game.settings.cell_width = 9
     active_game.settings.cell_height = 9
     active_game.settings.mines = 10
@@ -46,9 +48,9 @@ def test_game_over_loss(game_instance: Game):
     assert game_instance.cell_grid[5][0].button["text"] == "🕸"
     assert game_instance.reset_button['text'] == "LOST!"
 
-def test_game_over_victory():
+def test_game_over_victory(tmp_path):
     random.seed(0)
-    active_game = Game()
+    active_game = Game(backend=RecordingBackend(), save_file=str(tmp_path / 'save.bin'))
     active_game.settings.cell_width = 9
     active_game.settings.cell_height = 9
     active_game.settings.mines = 1
@@ -57,3 +59,245 @@ def test_game_over_victory():
     assert active_game.cell_grid[5][4].button["text"] == "🏴"
     assert active_game.reset_button['text'] == "WIN!!"
     active_game.root.destroy()
+
+def test_undo_redo_reveal(game_instance: Game):
+    game_instance.cell_grid[0][0].first_move()
+    unrevealed = game_instance.unrevealed_cell_count
+    game_instance.undo()
+    assert game_instance.unrevealed_cell_count == 71
+    assert not game_instance.cell_grid[0][0].revealed
+    assert game_instance.cell_grid[0][0].button["state"] == "normal"
+    assert Cell.left_click == Cell.first_move
+    game_instance.redo()
+    assert game_instance.unrevealed_cell_count == unrevealed
+    assert game_instance.cell_grid[0][0].revealed
+    assert Cell.left_click == Cell.regular_move
+
+def test_undo_flag(game_instance: Game):
+    game_instance.cell_grid[5][0].flag()
+    assert game_instance.flagged_counter.counter == 9
+    game_instance.undo()
+    assert not game_instance.cell_grid[5][0].flagged
+    assert game_instance.flagged_counter.counter == 10
+    game_instance.redo()
+    assert game_instance.cell_grid[5][0].button["text"] == "🏴"
+
+def test_undo_loss(game_instance: Game):
+    game_instance.settings.practice = False
+    game_instance.cell_grid[0][0].first_move()
+    game_instance.cell_grid[5][0].regular_move()
+    game_instance.undo()
+    assert game_instance.reset_button['text'] == "LOST!"
+    game_instance.settings.practice = True
+    game_instance.undo()
+    assert game_instance.reset_button['text'] == "RESET"
+    assert game_instance.cell_grid[5][0].button["text"] == ""
+    assert game_instance.cell_grid[5][0].button["state"] == "normal"
+    assert Cell.left_click == Cell.regular_move
+
+def chord_target(game: Game) -> Cell:
+    """Revealed number next to at least one unrevealed cell that is not a mine"""
+    for cell in game.not_mines:
+        neighbors = game.find_neighbors(cell)
+        if cell.revealed and cell.value and any(
+                not n.revealed and not n.is_mine for n in neighbors):
+            return cell
+
+def test_chord(game_instance: Game):
+    game_instance.cell_grid[0][0].first_move()
+    cell = chord_target(game_instance)
+    neighbors = list(game_instance.find_neighbors(cell))
+    # Not enough flags yet, nothing happens
+    cell.chord()
+    assert len(game_instance.history.undo_moves) == 1
+    for neighbor in neighbors:
+        if neighbor.is_mine:
+            neighbor.flag()
+    cell.chord()
+    assert all(n.revealed for n in neighbors if not n.is_mine)
+    assert game_instance.history.undo_moves[-1].kind == 'chord'
+    opened = game_instance.unrevealed_cell_count
+    game_instance.undo()
+    assert game_instance.unrevealed_cell_count > opened
+    game_instance.redo()
+    assert game_instance.unrevealed_cell_count == opened
+
+def test_chord_loss(game_instance: Game):
+    game_instance.settings.practice = True
+    game_instance.cell_grid[0][0].first_move()
+    cell = chord_target(game_instance)
+    neighbors = list(game_instance.find_neighbors(cell))
+    # Flag safe cells instead of the mines
+    wrong = [n for n in neighbors if not n.revealed and not n.is_mine][:cell.value]
+    if len(wrong) < cell.value:
+        pytest.skip("Not enough safe neighbors to flag wrongly")
+    for neighbor in wrong:
+        neighbor.flag()
+    cell.chord()
+    assert game_instance.reset_button['text'] == "LOST!"
+    game_instance.undo()
+    assert game_instance.reset_button['text'] == "RESET"
+    assert all(mine.button['text'] == "" for mine in game_instance.all_mines)
+    assert Cell.left_click == Cell.regular_move
+
+def test_chord_binding(game_instance: Game):
+    game_instance.cell_grid[0][0].first_move()
+    cell = chord_target(game_instance)
+    for neighbor in game_instance.find_neighbors(cell):
+        if neighbor.is_mine:
+            neighbor.flag()
+    cell.button.event_generate("<Button-2>")
+    assert game_instance.history.undo_moves[-1].kind == 'chord'
+
+def test_click_binding(game_instance: Game):
+    game_instance.cell_grid[5][0].button.event_generate("<Button-3>")
+    assert game_instance.cell_grid[5][0].flagged
+    game_instance.cell_grid[0][0].button.event_generate("<Button-1>")
+    assert game_instance.cell_grid[0][0].revealed
+
+def test_timer_ticks(game_instance: Game):
+    game_instance.cell_grid[0][0].first_move()
+    game_instance.root.advance(3000)
+    assert game_instance.timer.clock['text'] == "⏱0003"
+
+def test_many_games(game_instance: Game):
+    random.seed(1)
+    # Few enough mines for random clicking to win sometimes
+    game_instance.settings.mines = 3
+    game_instance.restart()
+    results = set()
+    for _ in range(200):
+        cells = [cell for column in game_instance.cell_grid for cell in column]
+        random.shuffle(cells)
+        for cell in cells:
+            if not game_instance.in_progress():
+                break
+            if not cell.revealed:
+                cell.left_click()
+        result = game_instance.reset_button['text']
+        if result == "WIN!!":
+            assert game_instance.unrevealed_cell_count == 0
+        results.add(result)
+        game_instance.restart()
+    assert results == {"WIN!!", "LOST!"}
+
+def test_seeded_mines(tmp_path):
+    mines = []
+    for _ in range(2):
+        active_game = Game(backend=RecordingBackend(), save_file=str(tmp_path / 'save.bin'), seed=3)
+        active_game.settings.cell_width = 30
+        active_game.settings.cell_height = 16
+        active_game.settings.mines = 99
+        active_game.start()
+        mines.append([active_game.cell_index(mine) for mine in active_game.all_mines])
+        active_game.root.destroy()
+    assert mines[0] == mines[1]
+    assert len(mines[0]) == 99
+
+def saved_game(save_file: str) -> int:
+    """Play the first move on a board big enough to be filled in several batches and save it
+    :return int: Index of a mine that got flagged
+    """
+    active_game = Game(backend=RecordingBackend(), save_file=save_file, seed=5)
+    active_game.settings.cell_width = 40
+    active_game.settings.cell_height = 40
+    active_game.settings.mines = 100
+    active_game.start()
+    active_game.root.advance(1000)
+    active_game.cell_grid[0][0].first_move()
+    mine = active_game.all_mines[0]
+    mine.flag()
+    active_game.save_game()
+    active_game.root.destroy()
+    return active_game.cell_index(mine)
+
+def test_save_kept_while_filling(tmp_path):
+    save_file = str(tmp_path / 'save.bin')
+    saved_game(save_file)
+    active_game = Game(backend=RecordingBackend(), save_file=save_file)
+    active_game.start()
+    assert active_game.filling is not None
+    active_game.save_game()
+    assert os.path.exists(save_file)
+    active_game.root.advance(1000)
+    assert active_game.filling is None
+    assert Cell.left_click == Cell.regular_move
+    active_game.root.destroy()
+
+def test_flags_during_fill(tmp_path):
+    save_file = str(tmp_path / 'save.bin')
+    mine = saved_game(save_file)
+    active_game = Game(backend=RecordingBackend(), save_file=save_file)
+    active_game.start()
+    # Flag the saved flag again, and a cell the snapshot has revealed
+    active_game.cell_at(mine).right_click()
+    active_game.cell_grid[0][0].right_click()
+    active_game.root.advance(1000)
+    assert active_game.cell_at(mine).flagged
+    assert not active_game.cell_grid[0][0].flagged
+    assert active_game.cell_grid[0][0].revealed
+    assert active_game.flagged_counter.counter == 99
+    active_game.root.destroy()
+
+def test_progressive_fill(tmp_path):
+    active_game = Game(backend=RecordingBackend(), save_file=str(tmp_path / 'save.bin'))
+    active_game.settings.cell_width = 40
+    active_game.settings.cell_height = 40
+    active_game.settings.mines = 100
+    active_game.start()
+    # First batch only, cells can not be revealed before mines are placed
+    assert 0 < len(active_game.cell_grid) < 40
+    assert Cell.left_click == Cell.disabled
+    while active_game.filling is not None:
+        active_game.root.run_due()
+    assert len(active_game.cell_grid) == 40
+    assert len(active_game.all_mines) == 100
+    assert Cell.left_click == Cell.first_move
+    active_game.root.destroy()
+
+def test_restart_cancels_fill(tmp_path):
+    active_game = Game(backend=RecordingBackend(), save_file=str(tmp_path / 'save.bin'))
+    active_game.settings.cell_width = 40
+    active_game.settings.cell_height = 40
+    active_game.settings.mines = 100
+    active_game.start()
+    old_minefield = active_game.minefield
+    pending = active_game.filling
+    active_game.restart()
+    assert pending not in active_game.root.scheduled
+    active_game.root.advance(1000)
+    # Only the new minefield got filled in
+    assert len(active_game.cell_grid) == 40
+    assert all(cell.button.parent is not old_minefield
+               for column in active_game.cell_grid for cell in column)
+    assert len(active_game.all_mines) == 100
+    active_game.root.destroy()
+
+@pytest.mark.parametrize('width, height, mines, mine_count', [
+    (0, 9, 10, 10),     # No columns
+    (9, 0, 10, 10),     # No rows
+    (2, 9, 10, 10),     # Narrower than the window allows
+    (41, 9, 10, 10),    # Wider than the window allows
+    (9, 9, 200, 81),    # More mines than cells
+    (9, 9, 0, 0),       # No mines
+    (9, 9, 10, 11),     # Mine count does not match the mines saved
+])
+def test_invalid_snapshot(tmp_path, width, height, mines, mine_count):
+    save_file = str(tmp_path / 'save.bin')
+    cell_count = width * height
+    mine_plane = [index < mine_count for index in range(cell_count)]
+    Snapshot(width, height, mines, 0, Snapshot.pack(mine_plane),
+             Snapshot.pack([False] * cell_count), Snapshot.pack([False] * cell_count)
+             ).save(save_file)
+    active_game = Game(backend=RecordingBackend(), save_file=save_file)
+    assert active_game.saved_game is None
+    active_game.root.destroy()
+
+def test_valid_snapshot(tmp_path):
+    save_file = str(tmp_path / 'save.bin')
+    mine_plane = [index < 10 for index in range(81)]
+    Snapshot(9, 9, 10, 0, Snapshot.pack(mine_plane),
+             Snapshot.pack([False] * 81), Snapshot.pack([False] * 81)).save(save_file)
+    active_game = Game(backend=RecordingBackend(), save_file=save_file)
+    assert active_game.saved_game is not None
+    active_game.root.destroy()
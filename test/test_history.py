@@ -0,0 +1,35 @@
+from classes import History
+
+
+def test_record_move():
+    history = History()
+    history.begin('reveal', 4)
+    history.opened(4, False)
+    history.opened(5, True)
+    history.commit()
+    move = history.undo_moves[-1]
+    assert move.kind == 'reveal'
+    assert move.origin == 4
+    assert list(move.opened) == [4, 5]
+    assert list(move.unflagged) == [5]
+
+def test_new_move_clears_redo():
+    history = History()
+    history.begin('flag', 1)
+    history.commit()
+    history.redo_moves.append(history.undo_moves.pop())
+    history.redoing = True
+    history.begin('flag', 2)
+    history.commit()
+    assert len(history.redo_moves) == 1
+    history.redoing = False
+    history.begin('flag', 3)
+    history.commit()
+    assert not history.redo_moves
+
+def test_not_recording():
+    history = History()
+    history.recording = False
+    history.begin('flag', 1)
+    history.commit()
+    assert not history.undo_moves
@@ -0,0 +1,20 @@
+import random
+from classes import place_mines
+
+
+def test_mine_count():
+    assert sum(place_mines(81, 10)) == 10
+    # Dense minefields pick safe cells instead
+    assert sum(place_mines(81, 70)) == 70
+    assert sum(place_mines(81, 80)) == 80
+
+def test_seeded():
+    first = place_mines(480, 99, random.Random(7))
+    second = place_mines(480, 99, random.Random(7))
+    assert first == second
+    assert first != place_mines(480, 99, random.Random(8))
+
+def test_huge_minefield():
+    # Timing is checked by minefield_benchmark.py
+    mine_map = place_mines(1000 * 1000, 200_000, random.Random(0))
+    assert sum(mine_map) == 200_000
@@ -0,0 +1,35 @@
+from classes.recording import RecordingBackend, RecordingRoot
+
+
+def test_schedule():
+    root = RecordingRoot()
+    calls = []
+    root.after(0, calls.append, 1)
+    cancelled = root.after(0, calls.append, 2)
+    root.after(60000, calls.append, 3)
+    root.after_cancel(cancelled)
+    root.run_due()
+    assert calls == [1]
+    assert root.next_due() > 0
+
+def test_advance():
+    root = RecordingRoot()
+    calls = []
+    root.after(2000, calls.append, 2)
+    root.after(1000, calls.append, 1)
+    root.advance(1500)
+    assert calls == [1]
+    root.advance(1000)
+    assert calls == [1, 2]
+
+def test_widget_options():
+    backend = RecordingBackend()
+    root = backend.root()
+    button = backend.button(root, text="RESET")
+    assert button["text"] == "RESET"
+    assert button["state"] == "normal"
+    button.configure(state="disabled")
+    assert button["state"] == "disabled"
+    # Only tracked when asked for
+    assert root.dirty is None
+    assert RecordingBackend(track_changes=True).root().dirty == set()
@@ -0,0 +1,40 @@
+import pytest
+from classes import Snapshot
+
+
+@pytest.fixture
+def snapshot_instance():
+    mines = [False] * 20
+    mines[3] = mines[17] = True
+    revealed = [False] * 20
+    revealed[0] = revealed[1] = revealed[9] = True
+    flagged = [False] * 20
+    flagged[17] = True
+    return Snapshot(5, 4, 2, 42,
+                    Snapshot.pack(mines), Snapshot.pack(revealed), Snapshot.pack(flagged))
+
+def test_pack(snapshot_instance: Snapshot):
+    assert len(snapshot_instance.mine_plane) == 3
+    assert Snapshot.bit(snapshot_instance.mine_plane, 3)
+    assert Snapshot.bit(snapshot_instance.mine_plane, 17)
+    assert not Snapshot.bit(snapshot_instance.mine_plane, 4)
+    assert Snapshot.pack([]) == b''
+
+def test_save_and_load(snapshot_instance: Snapshot, tmp_path):
+    path = str(tmp_path / Snapshot.file)
+    snapshot_instance.save(path)
+    loaded = Snapshot.load(path)
+    assert (loaded.width, loaded.height, loaded.mines, loaded.elapsed) == (5, 4, 2, 42)
+    assert loaded.mine_plane == snapshot_instance.mine_plane
+    assert loaded.revealed_plane == snapshot_instance.revealed_plane
+    assert loaded.flagged_plane == snapshot_instance.flagged_plane
+
+def test_load_invalid(tmp_path):
+    path = tmp_path / Snapshot.file
+    path.write_bytes(b'not a snapshot at all')
+    with pytest.raises(ValueError):
+        Snapshot.load(str(path))
+
+def test_count(snapshot_instance: Snapshot):
+    assert Snapshot.count(snapshot_instance.mine_plane) == 2
+    assert Snapshot.count(snapshot_instance.revealed_plane) == 3
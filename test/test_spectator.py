@@ -0,0 +1,80 @@
+import asyncio
+from classes.spectator import (
+    BoardMirror, SpectatorServer, SpectatorClient, SpectatorConnection, encode)
+
+BOARD = {'type': 'board', 'width': 3, 'height': 2, 'mines': 1,
+         'time': 0, 'status': 'RESET', 'cells': '......'}
+
+def test_mirror():
+    mirror = BoardMirror()
+    mirror.apply(BOARD)
+    mirror.apply({'type': 'reveal', 'cells': [0, 1, 3, 0]})
+    mirror.apply({'type': 'flag', 'cell': 5, 'on': True})
+    mirror.apply({'type': 'tick', 'time': 7})
+    assert mirror.rows() == ['1..', '.0F']
+    assert mirror.time == 7
+    assert mirror.board_message()['cells'] == '1..0.F'
+
+def test_broadcast_and_moves():
+    async def session():
+        server = SpectatorServer(port=0)
+        server.start()
+        server.publish(BOARD)
+        client = SpectatorClient()
+        await client.connect('127.0.0.1', server.port, server.token)
+        assert (await client.receive())['type'] == 'board'
+        server.publish({'type': 'reveal', 'cells': [2, 3]})
+        assert (await client.receive())['type'] == 'reveal'
+        assert client.mirror.rows()[0] == '.3.'
+
+        await client.send({'type': 'flag', 'cell': 4})
+        move = await asyncio.to_thread(server.moves.get, True, 5)
+        assert move == {'type': 'flag', 'cell': 4}
+        await client.close()
+        server.stop()
+    asyncio.run(session())
+
+def test_player_token():
+    async def session():
+        server = SpectatorServer(port=0, token='secret')
+        server.start()
+        client = SpectatorClient()
+        await client.connect('127.0.0.1', server.port, 'guess')
+        await client.send({'type': 'reveal', 'cell': 1})
+        await client.send({'type': 'join', 'role': 'player', 'token': 'secret'})
+        await client.send({'type': 'reveal', 'cell': 2})
+        # Messages are handled in order, so the first move was dropped
+        move = await asyncio.to_thread(server.moves.get, True, 5)
+        assert move == {'type': 'reveal', 'cell': 2}
+        await client.close()
+        server.stop()
+    asyncio.run(session())
+
+def test_slow_client_resync():
+    mirror = BoardMirror()
+    mirror.apply(BOARD)
+    async def flood():
+        connection = SpectatorConnection(None, 2)
+        for time in range(3):
+            mirror.apply({'type': 'tick', 'time': time})
+            connection.send(encode({'type': 'tick', 'time': time}), mirror)
+        return connection.queue
+    backlog = asyncio.run(flood())
+    # Third tick overflows the queue, replacing it with a board that already includes it
+    assert backlog.qsize() == 1
+    assert backlog.get_nowait() == encode(mirror.board_message())
+
+def test_stop_disconnects_clients(caplog):
+    async def session():
+        server = SpectatorServer(port=0)
+        server.start()
+        client = SpectatorClient()
+        await client.connect('127.0.0.1', server.port)
+        assert (await client.receive())['type'] == 'board'
+        await asyncio.to_thread(server.stop)
+        assert not server.thread.is_alive()
+        assert await asyncio.wait_for(client.receive(), 5) is None
+        await client.close()
+    asyncio.run(session())
+    # Handler was not left to be cancelled by asyncio during shutdown
+    assert not caplog.records
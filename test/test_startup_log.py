@@ -0,0 +1,14 @@
+from time import perf_counter
+from classes import StartupLog
+
+
+def test_mark_and_report():
+    log = StartupLog(perf_counter())
+    log.mark("imports")
+    log.mark("first frame")
+    assert [step for step, seconds in log.steps] == ["imports", "first frame"]
+    assert all(seconds >= 0 for step, seconds in log.steps)
+    lines = log.report().splitlines()
+    assert len(lines) == 3
+    assert lines[0].startswith("imports")
+    assert lines[-1].startswith("total") and lines[-1].endswith(" ms")
@@ -0,0 +1,136 @@
+import curses
+import os
+import pytest
+import random
+from main import Game
+from classes import Cell
+from classes.terminal import Terminal, TerminalBackend
+
+
+@pytest.fixture
+def terminal_game(tmp_path):
+    random.seed(0)
+    active_game = Game(backend=TerminalBackend(), save_file=str(tmp_path / 'save.bin'))
+    active_game.settings.cell_width = 9
+    active_game.settings.cell_height = 9
+    active_game.settings.mines = 10
+    active_game.start()
+    yield active_game
+    active_game.root.destroy()
+
+def test_dirty_widgets(terminal_game: Game):
+    terminal_game.root.dirty.clear()
+    terminal_game.cell_grid[5][0].flag()
+    assert terminal_game.cell_grid[5][0].button in terminal_game.root.dirty
+    assert terminal_game.flagged_counter.unflagged_count in terminal_game.root.dirty
+    assert len(terminal_game.root.dirty) == 2
+
+def test_play_to_victory(terminal_game: Game):
+    terminal_game.cell_grid[0][0].left_click()
+    assert Cell.left_click == Cell.regular_move
+    for cell in list(terminal_game.not_mines):
+        cell.left_click()
+    assert terminal_game.reset_button['text'] == "WIN!!"
+    assert terminal_game.unrevealed_cell_count == 0
+
+def test_huge_flood_fill(tmp_path):
+    active_game = Game(backend=TerminalBackend(), save_file=str(tmp_path / 'save.bin'))
+    active_game.settings.cell_width = 200
+    active_game.settings.cell_height = 200
+    active_game.settings.mines = 1
+    active_game.start()
+    while active_game.filling is not None:
+        active_game.root.run_due()
+    # Far deeper than the recursion limit would allow
+    active_game.cell_grid[0][0].left_click()
+    assert active_game.reset_button['text'] == "WIN!!"
+    active_game.root.destroy()
+
+class Screen:
+    """Stands in for a curses window, keeps what was written to each position"""
+
+    def __init__(self, lines: int, columns: int):
+        self.size = (lines, columns)
+        self.text: dict[tuple[int, int], str] = {}
+        self.cursor = (0, 0)
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, line: int, column: int, text: str, attribute: int):
+        self.text[(line, column)] = text
+
+    def move(self, line: int, column: int):
+        self.cursor = (line, column)
+
+    def erase(self):
+        self.text.clear()
+
+    def keypad(self, flag: bool): pass
+    def clrtoeol(self): pass
+    def noutrefresh(self): pass
+    def timeout(self, ms: int): pass
+
+
+@pytest.fixture
+def terminal(terminal_game: Game, monkeypatch):
+    # Curses functions that need a real terminal
+    monkeypatch.setattr(curses, 'has_colors', lambda: False)
+    monkeypatch.setattr(curses, 'doupdate', lambda: None)
+    # 3 cell columns and 4 rows of cells fit below the status bar
+    return Terminal(terminal_game, Screen(6, 6))
+
+def test_keys(terminal: Terminal):
+    game = terminal.game
+    terminal.handle(curses.KEY_LEFT)
+    terminal.handle(ord('k'))
+    assert terminal.cursor == [0, 0]
+    for _ in range(20):
+        terminal.handle(ord('l'))
+        terminal.handle(curses.KEY_DOWN)
+    assert terminal.cursor == [8, 8]
+    terminal.cursor = [5, 0]
+    terminal.handle(ord('f'))
+    assert game.cell_grid[5][0].flagged
+    terminal.handle(ord('u'))
+    assert not game.cell_grid[5][0].flagged
+    terminal.cursor = [0, 0]
+    terminal.handle(ord(' '))
+    assert game.cell_grid[0][0].revealed
+    terminal.handle(ord('n'))
+    assert not game.cell_grid[0][0].revealed
+
+def test_scroll(terminal: Terminal):
+    terminal.draw()
+    assert terminal.corner == [0, 0]
+    terminal.cursor = [5, 6]
+    terminal.draw()
+    assert terminal.corner == [3, 3]
+    # Selected cell is drawn at the bottom right of the screen
+    assert terminal.screen.cursor == (5, 4)
+    terminal.cursor = [1, 6]
+    terminal.draw()
+    assert terminal.corner == [1, 3]
+
+def test_redraw_changes_only(terminal: Terminal):
+    terminal.draw()
+    assert terminal.screen.text[(2, 0)] == '.'
+    terminal.screen.text.clear()
+    terminal.game.cell_grid[1][0].flag()
+    terminal.draw()
+    # Flagged cell and the status bar with the mine counter
+    assert terminal.screen.text == {(2, 2): 'F', (0, 0): terminal.screen.text[(0, 0)]}
+    assert terminal.screen.text[(0, 0)].startswith('09*')
+    assert not terminal.game.root.dirty
+
+def test_quit(terminal: Terminal):
+    game = terminal.game
+    game.cell_grid[0][0].left_click()
+    terminal.handle(ord('q'))
+    assert game.root.destroyed
+    assert os.path.exists(game.save_file)
+
+def test_light_cells(terminal_game: Game):
+    # Keys call cell methods directly, so no handlers are kept per cell
+    assert terminal_game.cell_grid[0][0].button.bindings is None
+    assert not hasattr(terminal_game.cell_grid[0][0].button, '__dict__')
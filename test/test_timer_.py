@@ -1,25 +1,31 @@
 import pytest
-import time
-import tkinter as tk
-from tkinter import Label, Frame
 from classes import Timer
+from classes.recording import RecordingBackend, RecordingWidget
 
 @pytest.fixture
 def timer_instance():
-    root = tk.Tk()
-    location = Frame(root)
+    backend = RecordingBackend()
+    root = backend.root()
+    location = backend.frame(root)
     font = ('Arial', 12)
-    timer = Timer(location, font)
+    timer = Timer(location, font, backend)
     yield timer
     root.destroy()
 
 def test_initialization(timer_instance: Timer):
     assert timer_instance.counter == 0
     assert timer_instance.updating is None
-    assert isinstance(timer_instance.clock, Label)
+    assert isinstance(timer_instance.clock, RecordingWidget)
 
 def test_start(timer_instance: Timer):
     timer_instance.start()
     assert timer_instance.updating is not None
     assert timer_instance.clock['text'] == "⏱0000"
     assert timer_instance.counter == 1
+
+def test_stop(timer_instance: Timer):
+    timer_instance.start()
+    timer_instance.clock.root.advance(2500)
+    timer_instance.stop()
+    timer_instance.clock.root.advance(2000)
+    assert timer_instance.clock['text'] == "⏱0002"